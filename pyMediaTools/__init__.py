@@ -1,10 +1,11 @@
 
-from pyMediaTools.logging_config import setup_logging, get_logger
+from pyMediaTools.logging_config import setup_logging, shutdown_logging, get_logger
 from pyMediaTools.core import config
 
 
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
     "get_logger",
     "config",
 ]
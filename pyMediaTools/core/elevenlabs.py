@@ -3,19 +3,42 @@ ElevenLabs API
 """
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import binascii
 import json
 import pysrt
 from PySide6.QtCore import QThread, Signal
-from ..utils import load_project_config
+from ..utils import load_project_config, json_loads
 from .subtitle_writer import SubtitleWriter
 from .subtitle_builder import SubtitleSegmentBuilder
 from .translation_manager import TranslationManager
+from .translation_cache import get_translation_cache
 from .groq_analysis import extract_keywords
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 音频分块解码写入：每块 base64 文本解码后约 256 KiB，每写入若干块让出一次线程
+_AUDIO_B64_CHUNK = (256 * 1024 // 3) * 4
+_AUDIO_YIELD_EVERY = 4
+_B64_WHITESPACE = ("\n", "\r", " ", "\t")
+
+
+def _create_session():
+    """
+    所有 ElevenLabs 请求共享的会话：复用 HTTPS 连接，
+    load_voices 后紧接的额度查询、连续生成等请求无需重新进行 TCP + TLS 握手。
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
 # ============================================================================
 # ElevenLabs API 常量定义 - 模型、语言、情绪支持
 # ============================================================================
@@ -178,6 +201,29 @@ EMOTION_DISPLAY_MAP = {emotion_key: f"{info['emoji']} {info['name']}" for emotio
 DISPLAY_TO_EMOTION_MAP = {display: emotion_key for emotion_key, display in EMOTION_DISPLAY_MAP.items()}
 
 
+class _ApiError(Exception):
+    """API 返回非预期结果，消息直接展示给用户"""
+
+
+_USER_URL = "https://api.elevenlabs.io/v1/user"
+_MODELS_URL = "https://api.elevenlabs.io/v1/models"
+_VOICES_URL = "https://api.elevenlabs.io/v1/voices"
+
+
+def _fetch_quota(api_key):
+    """GET /v1/user，返回 (usage, limit)"""
+    headers = {"xi-api-key": api_key}
+    response = _SESSION.get(_USER_URL, headers=headers, timeout=15)
+    if response.status_code != 200:
+        raise _ApiError(f"获取额度失败: {response.text}")
+    data = json_loads(response.content)
+    if 'subscription' not in data:
+        raise _ApiError("未能解析订阅信息。")
+    usage = data['subscription'].get('character_count', 0)
+    limit = data['subscription'].get('character_limit', 0)
+    return usage, limit
+
+
 class QuotaWorker(QThread):
     """
     从 ElevenLabs API 获取额度信息
@@ -192,20 +238,8 @@ class QuotaWorker(QThread):
         self.api_key = api_key or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
 
     def run(self):
-        url = "https://api.elevenlabs.io/v1/user"
-        headers = {"xi-api-key": self.api_key}
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                if 'subscription' in data:
-                    usage = data['subscription'].get('character_count', 0)
-                    limit = data['subscription'].get('character_limit', 0)
-                    self.quota_info.emit(usage, limit)
-                else:
-                    self.error.emit("未能解析订阅信息。")
-            else:
-                self.error.emit(f"获取额度失败: {response.text}")
+            self.quota_info.emit(*_fetch_quota(self.api_key))
         except Exception as e:
             self.error.emit(str(e))
 
@@ -303,13 +337,13 @@ class TTSWorker(QThread):
         logger.info(f"使用模型: {self.model_id}")
 
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=120)
+            response = _SESSION.post(url, json=data, headers=headers, timeout=120)
             if response.status_code != 200:
                 self.error.emit(f"TTS 生成失败 ({response.status_code}): {response.text}")
                 return
 
             try:
-                resp_json = response.json()
+                resp_json = json_loads(response.content)
             except Exception:
                 self.error.emit("无法解析 TTS 返回的 JSON。")
                 return
@@ -328,6 +362,37 @@ class TTSWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+    def _write_audio(self, audio_b64):
+        """
+        分块解码 base64 音频，先写入同目录的临时文件，成功后再替换目标文件。
+        每块之间交替进行解码(持有 GIL)与写盘(释放 GIL)，并定期让出线程，
+        避免整段 b64decode 长时间阻塞 GUI 线程的信号处理。
+        解码失败时删除临时文件并重新抛出异常，已存在的目标文件保持不变。
+        """
+        # 含换行等空白时分块偏移会与 4 字符分组错位，先去掉空白
+        if any(ws in audio_b64 for ws in _B64_WHITESPACE):
+            audio_b64 = "".join(audio_b64.split())
+
+        tmp_path = os.fspath(self.save_path) + ".part"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            for index, offset in enumerate(range(0, len(audio_b64), _AUDIO_B64_CHUNK)):
+                view = memoryview(base64.b64decode(audio_b64[offset:offset + _AUDIO_B64_CHUNK]))
+                while view:
+                    view = view[os.write(fd, view):]
+                if index % _AUDIO_YIELD_EVERY == _AUDIO_YIELD_EVERY - 1:
+                    QThread.yieldCurrentThread()
+        except BaseException:
+            os.close(fd)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        os.close(fd)
+        os.replace(tmp_path, self.save_path)
+
     def process_response(self, resp_json):
         """
         处理来自API或缓存的JSON响应。
@@ -341,15 +406,11 @@ class TTSWorker(QThread):
                 return
 
             try:
-                audio_bytes = base64.b64decode(audio_b64)
-            except Exception:
+                os.makedirs(os.path.dirname(self.save_path) or ".", exist_ok=True)
+                self._write_audio(audio_b64)
+            except (binascii.Error, ValueError):
                 self.error.emit("无法解码返回的音频 base64 数据。")
                 return
-
-            try:
-                os.makedirs(os.path.dirname(self.save_path) or ".", exist_ok=True)
-                with open(self.save_path, "wb") as f:
-                    f.write(audio_bytes)
             except Exception as e:
                 self.error.emit(f"保存音频失败: {str(e)}")
                 return
@@ -367,14 +428,20 @@ class TTSWorker(QThread):
                     if not chars or not starts or not ends:
                         logger.warning("alignment 数据不完整，跳过字幕生成。")
                     else:
-                        cfg = load_project_config().get('elevenlabs', {}).copy()
+                        # 配置只解析一次，翻译与关键词提取共用同一份 Groq 配置
+                        full_cfg = load_project_config()
+                        cfg = full_cfg.get('elevenlabs', {}).copy()
+                        groq_cfg = full_cfg.get('groq', {})
+                        groq_key = self.groq_api_key or groq_cfg.get('api_key') or os.getenv("GROQ_API_KEY")
                         # 使用 UI 传入的视频设置覆盖配置文件的默认值 (包含断行阈值、每行最大字符等)
                         if self.video_settings:
                             cfg.update(self.video_settings)
                         
                         # 2.1 生成标准字幕（始终）
                         builder = SubtitleSegmentBuilder(config=cfg)
-                        standard_segments = builder.build_segments(chars, starts, ends, word_level=False)
+                        # 字符级断点只预计算一次，标准/逐词/翻译三种分段共用
+                        atoms = builder.build_atoms(chars, starts, ends)
+                        standard_segments = builder.build_segments_from_atoms(atoms, word_level=False)
                         standard_srt_path = base_path + ".srt"
                         SubtitleWriter.write_srt(standard_srt_path, standard_segments)
                         message = f"标准字幕已保存: {standard_srt_path}"
@@ -382,9 +449,9 @@ class TTSWorker(QThread):
                         
                         # 2.2 生成逐词字幕（可选）
                         if self.word_level:
-                            word_segments = builder.build_segments(
-                                chars, starts, ends, 
-                                word_level=True, 
+                            word_segments = builder.build_segments_from_atoms(
+                                atoms,
+                                word_level=True,
                                 words_per_line=self.words_per_line
                             )
                             word_srt_path = base_path + "_word.srt"
@@ -394,23 +461,23 @@ class TTSWorker(QThread):
                         
                         # 2.3 生成翻译字幕（可选）
                         if self.translate:
-                            full_cfg = load_project_config()
-                            groq_cfg = full_cfg.get('groq', {})
-                            api_key = self.groq_api_key or groq_cfg.get('api_key') or os.getenv("GROQ_API_KEY")
                             model = self.groq_model or groq_cfg.get('model', 'openai/gpt-oss-120b')
                             
-                            if api_key:
+                            if groq_key:
                                 # ✨ 关键改进：翻译时使用完整句子分段（ignore_line_length=True）
                                 # 这样可以避免被行长度限制打断的不完整句子，提高翻译准确性
-                                translation_segments = builder.build_segments(
-                                    chars, starts, ends, 
+                                translation_segments = builder.build_segments_from_atoms(
+                                    atoms,
                                     word_level=False,
                                     ignore_line_length=True  # 忽略行长度限制，只按标点和停顿分割
                                 )
                                 
                                 try:
-                                    translator = TranslationManager(api_key=api_key, model=model)
-                                    translated_segments = translator.translate_segments(translation_segments)
+                                    translator = TranslationManager(api_key=groq_key, model=model, cache=get_translation_cache())
+                                    try:
+                                        translated_segments = translator.translate_segments(translation_segments)
+                                    finally:
+                                        translator.close()
                                     trans_srt_path = base_path + "_cn.srt"
                                     SubtitleWriter.write_srt(trans_srt_path, translated_segments)
                                     message = f"翻译字幕已保存: {trans_srt_path}"
@@ -440,14 +507,10 @@ class TTSWorker(QThread):
                                 
                                 # Extract keywords if enabled
                                 if self.keyword_highlight:
-                                    # Use configured Groq key, or fall back to env/config
-                                    full_cfg = load_project_config()
-                                    groq_cfg = full_cfg.get('groq', {})
-                                    g_key = self.groq_api_key or groq_cfg.get('api_key') or os.getenv("GROQ_API_KEY")
-                                    if g_key:
+                                    if groq_key:
                                         logger.info("正在使用 Groq 分析重点关键词...")
                                         try:
-                                            keywords = extract_keywords(self.text, g_key, model=self.groq_model or "openai/gpt-oss-120b")
+                                            keywords = extract_keywords(self.text, groq_key, model=self.groq_model or "openai/gpt-oss-120b")
                                             logger.info(f"提取到的关键词: {keywords}")
                                             self.video_settings['keywords'] = keywords
                                         except Exception as e:
@@ -505,7 +568,7 @@ class SFXWorker(QThread):
         }
         params = {"output_format": self.output_format}
         try:
-            response = requests.post(url, json=data, headers=headers, params=params, timeout=120)
+            response = _SESSION.post(url, json=data, headers=headers, params=params, timeout=120)
             # 接受所有 2xx 状态为成功
             if 200 <= response.status_code < 300:
                 os.makedirs(os.path.dirname(self.save_path) or ".", exist_ok=True)
@@ -537,15 +600,92 @@ class SFXWorker(QThread):
 
 
 # ============================================================================
-# ModelListWorker: 从 API 获取可用模型列表及其功能
+# InitLoadWorker: 从 API 获取可用模型列表、声音列表及额度
 # ============================================================================
-class ModelListWorker(QThread):
+def _fetch_models(api_key):
+    """GET /v1/models，返回模型信息字典列表"""
+    headers = {
+        "xi-api-key": api_key,
+        "Accept": "application/json"
+    }
+    response = _SESSION.get(_MODELS_URL, headers=headers, timeout=15)
+    if response.status_code != 200:
+        raise _ApiError(f"获取模型列表失败 ({response.status_code}): {response.text}")
+    data = response.json()
+    models_list = []
+
+    # 响应是一个数组
+    if isinstance(data, list):
+        for model in data:
+            model_id = model.get('model_id')
+            if model_id:
+                models_list.append({
+                    'model_id': model_id,
+                    'name': model.get('name', model_id),
+                    'description': model.get('description', ''),
+                    'can_do_text_to_speech': model.get('can_do_text_to_speech', False),
+                    'can_do_voice_conversion': model.get('can_do_voice_conversion', False),
+                    'can_use_style': model.get('can_use_style', False),
+                    'can_use_speaker_boost': model.get('can_use_speaker_boost', False),
+                    'serves_pro_voices': model.get('serves_pro_voices', False),
+                    'requires_alpha_access': model.get('requires_alpha_access', False),
+                    'token_cost_factor': model.get('token_cost_factor', 1.0),
+                    'maximum_text_length_per_request': model.get('maximum_text_length_per_request', 1000),
+                    'max_characters_request_free_user': model.get('max_characters_request_free_user'),
+                    'max_characters_request_subscribed_user': model.get('max_characters_request_subscribed_user'),
+                    'languages': model.get('languages', []),  # 列表
+                    'concurrency_group': model.get('concurrency_group', ''),
+                })
+
+    if not models_list:
+        raise _ApiError("未能从 API 响应中解析任何模型。")
+
+    logger.info(f"成功获取 {len(models_list)} 个模型")
+    return models_list
+
+
+def _model_error_text(e):
+    if isinstance(e, _ApiError):
+        return str(e)
+    return f"获取模型列表异常: {str(e)}"
+
+
+def _fetch_voices(api_key):
+    """GET /v1/voices，返回 (name, voice_id, preview_url, category) 列表"""
+    headers = {"xi-api-key": api_key, "Accept": "application/json"}
+    response = _SESSION.get(_VOICES_URL, headers=headers, timeout=15)
+    if response.status_code != 200:
+        raise _ApiError(f"获取声音列表失败 ({response.status_code}): {response.text}")
+    data = json_loads(response.content)
+    voices_list = []
+    if isinstance(data, dict) and "voices" in data:
+        raw = data["voices"]
+    elif isinstance(data, list):
+        raw = data
+    else:
+        raw = []
+
+    for v in raw:
+        vid = v.get("voice_id") or v.get("id") or v.get("uuid")
+        name = v.get("name") or v.get("label") or vid
+        preview_url = v.get("preview_url")
+        category = v.get("category", "unspecified")
+        if vid and name:
+            voices_list.append((name, vid, preview_url, category))
+    return voices_list
+
+
+class InitLoadWorker(QThread):
     """
-    从 ElevenLabs API 获取可用模型列表
-    根据 API 文档: GET /v1/models
+    一次性加载模型列表、声音列表和额度
+    三个请求在同一线程中依次发出，复用同一条 keep-alive 连接，只需一次 TLS 握手；
+    每一步独立成功/失败，互不影响。
     """
-    finished = Signal(list)  # 发送 (model_id, model_info_dict) 元组列表
+    models_loaded = Signal(list)
+    voices_loaded = Signal(list)
+    quota_info = Signal(int, int)  # (usage, limit)
     error = Signal(str)
+    quota_error = Signal(str)
 
     def __init__(self, api_key=None):
         super().__init__()
@@ -553,87 +693,40 @@ class ModelListWorker(QThread):
         self.api_key = api_key or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
 
     def run(self):
-        url = "https://api.elevenlabs.io/v1/models"
-        headers = {
-            "xi-api-key": self.api_key,
-            "Accept": "application/json"
-        }
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                models_list = []
-                
-                # 响应是一个数组
-                if isinstance(data, list):
-                    for model in data:
-                        model_id = model.get('model_id')
-                        if model_id:
-                            models_list.append({
-                                'model_id': model_id,
-                                'name': model.get('name', model_id),
-                                'description': model.get('description', ''),
-                                'can_do_text_to_speech': model.get('can_do_text_to_speech', False),
-                                'can_do_voice_conversion': model.get('can_do_voice_conversion', False),
-                                'can_use_style': model.get('can_use_style', False),
-                                'can_use_speaker_boost': model.get('can_use_speaker_boost', False),
-                                'serves_pro_voices': model.get('serves_pro_voices', False),
-                                'requires_alpha_access': model.get('requires_alpha_access', False),
-                                'token_cost_factor': model.get('token_cost_factor', 1.0),
-                                'maximum_text_length_per_request': model.get('maximum_text_length_per_request', 1000),
-                                'max_characters_request_free_user': model.get('max_characters_request_free_user'),
-                                'max_characters_request_subscribed_user': model.get('max_characters_request_subscribed_user'),
-                                'languages': model.get('languages', []),  # 列表
-                                'concurrency_group': model.get('concurrency_group', ''),
-                            })
-                
-                if not models_list:
-                    self.error.emit("未能从 API 响应中解析任何模型。")
-                    return
-                
-                logger.info(f"成功获取 {len(models_list)} 个模型")
-                self.finished.emit(models_list)
-            else:
-                self.error.emit(f"获取模型列表失败 ({response.status_code}): {response.text}")
+            self.models_loaded.emit(_fetch_models(self.api_key))
+        except Exception as e:
+            self.error.emit(_model_error_text(e))
+
+        try:
+            self.voices_loaded.emit(_fetch_voices(self.api_key))
         except Exception as e:
-            self.error.emit(f"获取模型列表异常: {str(e)}")
+            self.error.emit(str(e))
+
+        try:
+            self.quota_info.emit(*_fetch_quota(self.api_key))
+        except Exception as e:
+            self.quota_error.emit(str(e))
 
 
-class VoiceListWorker(QThread):
-    finished = Signal(list)
+class PreviewFetchWorker(QThread):
+    """
+    下载声音试听样本，供界面缓存后从内存播放
+    """
+    finished = Signal(str, bytes)  # (preview_url, 音频数据)
     error = Signal(str)
 
-    def __init__(self, api_key=None):
+    def __init__(self, preview_url):
         super().__init__()
-        cfg = load_project_config().get('elevenlabs', {})
-        self.api_key = api_key or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
+        self.preview_url = preview_url
 
     def run(self):
-        url = "https://api.elevenlabs.io/v1/voices"
-        headers = {"xi-api-key": self.api_key, "Accept": "application/json"}
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _SESSION.get(self.preview_url, timeout=20)
             if response.status_code == 200:
-                data = response.json()
-                voices_list = []
-                if isinstance(data, dict) and "voices" in data:
-                    raw = data["voices"]
-                elif isinstance(data, list):
-                    raw = data
-                else:
-                    raw = []
-
-                for v in raw:
-                    vid = v.get("voice_id") or v.get("id") or v.get("uuid")
-                    name = v.get("name") or v.get("label") or vid
-                    preview_url = v.get("preview_url")
-                    category = v.get("category", "unspecified")
-                    if vid and name:
-                        voices_list.append((name, vid, preview_url, category))
-
-                self.finished.emit(voices_list)
+                self.finished.emit(self.preview_url, response.content)
             else:
-                self.error.emit(f"获取声音列表失败 ({response.status_code}): {response.text}")
+                self.error.emit(f"获取试听样本失败 ({response.status_code})")
         except Exception as e:
             self.error.emit(str(e))
 
@@ -665,7 +758,7 @@ class LibrarySearchWorker(QThread):
             params["page_token"] = self.page_token
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=20)
+            response = _SESSION.get(url, headers=headers, params=params, timeout=20)
             if response.status_code == 200:
                 data = response.json()
                 voices_list = data.get("voices", [])
@@ -709,7 +802,7 @@ class LibraryAddWorker(QThread):
         data = {"new_name": self.new_name} if self.new_name else {}
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=20)
+            response = _SESSION.post(url, headers=headers, json=data, timeout=20)
             if response.status_code == 200:
                 resp_json = response.json()
                 new_voice_id = resp_json.get("voice_id", self.voice_id)
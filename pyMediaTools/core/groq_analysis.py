@@ -2,11 +2,45 @@ import time
 import requests
 import json
 import re
+from functools import lru_cache
 from PySide6.QtCore import QThread, Signal
 from ..logging_config import get_logger
+from ..utils import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
+_KEYWORD_SYSTEM_PROMPT = (
+    "You are an expert content analyzer. Your task is to identify the most important keywords or short phrases "
+    "in the provided text that should be highlighted for emphasis in a video subtitle. "
+    "Select only the most impactful words (nouns, verbs, key adjectives). "
+    "Return the result STRICTLY as a valid JSON object with a key 'keywords' containing the list of strings. "
+    "Example: {\"keywords\": [\"freedom\", \"innovation\", \"future\"]}"
+)
+
+
+@lru_cache(maxsize=8)
+def _keyword_envelope_head(model: str) -> bytes:
+    """
+    预序列化关键词请求中与文本无关的部分（model / system prompt 等）。
+    messages 放在最后，去掉结尾的 "]}" 后即可直接拼接 user 消息。
+    """
+    envelope = json_dumps({
+        "model": model,
+        "temperature": 0.3,
+        "response_format": {"type": "json_object"},
+        "messages": [{"role": "system", "content": _KEYWORD_SYSTEM_PROMPT}],
+    })
+    return envelope[:-2]
+
+
+def _keyword_request_body(text: str, model: str) -> bytes:
+    """拼接完整的关键词请求体，每次调用只需序列化 text"""
+    return (
+        _keyword_envelope_head(model)
+        + b',{"role":"user","content":' + json_dumps(text) + b'}]}'
+    )
+
+
 def extract_keywords(text, api_key, model="openai/gpt-oss-120b"):
     """
     Analyzes the text and returns a list of keywords/phrases to highlight.
@@ -21,23 +55,7 @@ def extract_keywords(text, api_key, model="openai/gpt-oss-120b"):
         "Content-Type": "application/json"
     }
 
-    system_prompt = (
-        "You are an expert content analyzer. Your task is to identify the most important keywords or short phrases "
-        "in the provided text that should be highlighted for emphasis in a video subtitle. "
-        "Select only the most impactful words (nouns, verbs, key adjectives). "
-        "Return the result STRICTLY as a valid JSON object with a key 'keywords' containing the list of strings. "
-        "Example: {\"keywords\": [\"freedom\", \"innovation\", \"future\"]}"
-    )
-
-    data = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text}
-        ],
-        "temperature": 0.3,
-        "response_format": {"type": "json_object"} 
-    }
+    body = _keyword_request_body(text, model)
 
     retry_count = 0
     max_retries = 3
@@ -45,9 +63,9 @@ def extract_keywords(text, api_key, model="openai/gpt-oss-120b"):
 
     while retry_count <= max_retries:
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = requests.post(url, headers=headers, data=body, timeout=30)
             if response.status_code == 200:
-                res_json = response.json()
+                res_json = json_loads(response.content)
                 content = res_json['choices'][0]['message']['content']
                 
                 # Attempt to parse JSON
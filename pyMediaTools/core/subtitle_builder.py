@@ -1,8 +1,27 @@
+import math
 import re
 import string
 
 from .cjk_tokenizer import CJKTokenizer
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# _char_flags 中的字符类别位
+_FLAG_DELIMITER = 1
+_FLAG_SENTENCE_END = 2
+
+# 连续空白（与 str.split() 的空白判定一致），用于压缩为单个空格
+_WS_RE = re.compile(r"\s+")
+
+
+def _squash_spaces(text):
+    """压缩连续空白并去除首尾空白，等价于 " ".join(text.split())"""
+    return _WS_RE.sub(" ", text).strip()
+
+
 class SubtitleSegmentBuilder:
     """
     字幕分段生成器：优化版
@@ -31,6 +50,18 @@ class SubtitleSegmentBuilder:
         self.max_chars_per_line = self.config.get("srt_max_chars", 35)
         self.pause_threshold = self.config.get("srt_pause_threshold", 0.2)
 
+        # 标点合并使用的字符集，随配置一起构建（reconfigure 会重新调用 __init__）
+        self._punctuation_chars = frozenset(self.delimiters) | frozenset(self.sentence_enders)
+        # 字符 -> 类别位，回退模式下每个字符只需一次字典查找
+        self._char_flags = dict.fromkeys(self.delimiters, _FLAG_DELIMITER)
+        for char in self.sentence_enders:
+            self._char_flags[char] = self._char_flags.get(char, 0) | _FLAG_SENTENCE_END
+        # 词级模式下一次正则扫描判断是否含句末标点（兼容多字符的配置项）
+        self._ender_pattern = (
+            re.compile("|".join(re.escape(e) for e in sorted(self.sentence_enders, key=len, reverse=True)))
+            if self.sentence_enders else None
+        )
+
     def build_segments(self, chars, char_starts, char_ends, word_level=False, words_per_line=1, ignore_line_length=False):
         """
         构建字幕分段入口
@@ -38,57 +69,217 @@ class SubtitleSegmentBuilder:
         if not chars:
             return []
 
+        atoms = self.build_atoms(chars, char_starts, char_ends)
+        return self.build_segments_from_atoms(
+            atoms,
+            word_level=word_level,
+            words_per_line=words_per_line,
+            ignore_line_length=ignore_line_length,
+        )
+
+    def build_atoms(self, chars, char_starts, char_ends):
+        """
+        一次性预计算字符级断点信息，供多种分段方式复用。
+        同一段对齐数据需要生成标准/逐词/翻译多份字幕时，
+        先调用本方法，再多次调用 build_segments_from_atoms，避免重复遍历。
+
+        Returns:
+            dict: {
+                "chars", "starts", "ends": 原始字符及时间戳,
+                "vector": NumPy 形式的断点与累计长度信息（NumPy 可用时）,
+                "hard_breaks": 每个字符后的硬断点原因（"punct" / "pause" / None，回退模式）,
+                "words": 词级模式使用的已合并词列表（首次需要时构建）
+            }
+        """
+        vector = self._vector_boundaries(chars, char_starts, char_ends)
+        return {
+            "chars": chars,
+            "starts": char_starts,
+            "ends": char_ends,
+            "vector": vector,
+            "hard_breaks": None if vector is not None else self._hard_breaks(chars, char_starts, char_ends),
+            "words": None,
+        }
+
+    def _hard_breaks(self, chars, char_starts, char_ends):
+        """
+        逐字符计算硬断点原因（无 NumPy 时的回退实现）
+        """
+        # 循环内频繁访问的属性/方法绑定为局部变量，减少属性查找
+        flags_get = self._char_flags.get
+        pause_threshold = self.pause_threshold
+        hard_breaks = []
+        append = hard_breaks.append
+        last_index = len(chars) - 1
+        for i, char in enumerate(chars):
+            if flags_get(char, 0) & _FLAG_SENTENCE_END:
+                append("punct")
+            elif i < last_index and char_starts[i + 1] - char_ends[i] >= pause_threshold:
+                append("pause")
+            else:
+                append(None)
+        return hard_breaks
+
+    def _vector_boundaries(self, chars, char_starts, char_ends):
+        """
+        用 NumPy 一次性计算句末标点、停顿与分隔符信息，以及累计行长度。
+        仅在 NumPy 可用且所有元素均为字符串时启用，否则返回 None，
+        由调用方走逐字符回退逻辑。
+        """
+        if np is None or not chars:
+            return None
+
+        chars_arr = np.asarray(chars)
+        if chars_arr.dtype.kind != "U":
+            return None
+
+        starts = np.asarray(char_starts, dtype=np.float64)
+        ends = np.asarray(char_ends, dtype=np.float64)
+
+        sentence_mask = self._isin(chars_arr, self.sentence_enders)
+        hard_mask = sentence_mask.copy()
+        hard_mask[:-1] |= (starts[1:] - ends[:-1]) >= self.pause_threshold
+
+        return {
+            "hard_index": np.flatnonzero(hard_mask),
+            "sentence_mask": sentence_mask,
+            "delim_index": np.flatnonzero(self._isin(chars_arr, self.delimiters)),
+            # cumlen[i] 为前 i+1 个元素拼接后的长度，与逐字符累加 len() 的结果一致
+            "cumlen": np.cumsum(np.char.str_len(chars_arr)),
+        }
+
+    @staticmethod
+    def _isin(chars_arr, charset):
+        if not charset:
+            return np.zeros(chars_arr.shape, dtype=bool)
+        return np.isin(chars_arr, list(charset))
+
+    def build_segments_from_atoms(self, atoms, word_level=False, words_per_line=1, ignore_line_length=False):
+        """
+        基于 build_atoms 的结果构建字幕分段，参数含义同 build_segments
+        """
+        if not atoms["chars"]:
+            return []
+
         if word_level:
-            segs = self._build_segments_word_level(
-                chars, char_starts, char_ends, words_per_line
-            )
+            if atoms["words"] is None:
+                atoms["words"] = self._build_words(atoms["chars"], atoms["starts"], atoms["ends"])
+            segs = self._group_words(atoms["words"], words_per_line)
         else:
-            segs = self._build_segments_standard(chars, char_starts, char_ends, ignore_line_length)
+            segs = self._build_segments_standard(
+                atoms["chars"], atoms["starts"], atoms["ends"], ignore_line_length, atoms=atoms,
+            )
 
         # 一致化后处理，修复括号、首位标点及超长兜底
         return self._post_process_segments(segs)
 
-    def _build_segments_standard(self, chars, char_starts, char_ends, ignore_line_length=False):
+    def _build_segments_standard(self, chars, char_starts, char_ends, ignore_line_length=False, atoms=None):
         """
         标准分段模式：改进了长句合并逻辑
         """
+        if atoms is None:
+            atoms = self.build_atoms(chars, char_starts, char_ends)
+
+        if atoms["vector"] is not None:
+            sentences = self._split_lines_vectorized(chars, char_starts, char_ends, atoms["vector"], ignore_line_length)
+        else:
+            sentences = self._split_lines(chars, char_starts, char_ends, atoms["hard_breaks"], ignore_line_length)
+        return self._merge_short_sentences(sentences)
+
+    def _split_lines_vectorized(self, chars, char_starts, char_ends, vector, ignore_line_length):
+        """
+        按预计算的断点索引切分：只在断点之间切片拼接文本。
+        行长度断点通过对累计长度 cumlen 与分隔符索引做 searchsorted 得到，
+        每段只需常数次查找，不再逐字符累加字符串或判断长度。
+        """
+        sentence_mask = vector["sentence_mask"]
+        delim_index = vector["delim_index"]
+        cumlen = vector["cumlen"]
+        last_index = len(chars) - 1
+
+        boundaries = [
+            (index, "punct" if sentence_mask[index] else "pause")
+            for index in vector["hard_index"].tolist()
+        ]
+        if not boundaries or boundaries[-1][0] != last_index:
+            boundaries.append((last_index, "last"))
+
+        max_chars = self.max_chars_per_line
+        force_chars = self.max_chars_per_line * 1.5
+
         sentences = []
-        current_line_text = ""
+        pos = 0
+        for hard, hard_reason in boundaries:
+            if not ignore_line_length:
+                # 标点/停顿断点优先于长度；只有末尾（last）处仍需判断长度
+                limit = hard if hard_reason == "last" else hard - 1
+                while pos <= limit:
+                    base = int(cumlen[pos - 1]) if pos else 0
+                    # 行长度首次达到阈值的位置（之后遇到分隔符即可断开）
+                    first = max(pos, int(np.searchsorted(cumlen, base + max_chars)))
+                    if first > limit:
+                        break
+                    # 行长度达到 1.5 倍阈值的位置（无论是否为分隔符都强制断开）
+                    forced = max(pos, int(np.searchsorted(cumlen, base + force_chars)))
+                    k = int(np.searchsorted(delim_index, first))
+                    cut = min(int(delim_index[k]), forced) if k < len(delim_index) else forced
+                    if cut > limit:
+                        break
+                    self._append_sentence(sentences, chars, char_starts, char_ends, pos, cut, "length")
+                    pos = cut + 1
+
+            if pos <= hard:
+                self._append_sentence(sentences, chars, char_starts, char_ends, pos, hard, hard_reason)
+                pos = hard + 1
+        return sentences
+
+    @staticmethod
+    def _append_sentence(sentences, chars, char_starts, char_ends, first, last, reason):
+        clean_text = _squash_spaces("".join(chars[first:last + 1]))
+        if clean_text:
+            sentences.append({
+                "text": clean_text,
+                "start": char_starts[first],
+                "end": char_ends[last],
+                "reason": reason,
+            })
+
+    def _split_lines(self, chars, char_starts, char_ends, hard_breaks, ignore_line_length):
+        """
+        逐字符切分（无 NumPy 时的回退实现）
+        """
+        flags_get = self._char_flags.get
+        max_chars = self.max_chars_per_line
+        force_chars = self.max_chars_per_line * 1.5
+        last_index = len(chars) - 1
+
+        sentences = []
+        current_line_buf = []
+        current_line_len = 0
         current_line_start = None
 
         for i, char in enumerate(chars):
             if current_line_start is None:
                 current_line_start = char_starts[i]
 
-            current_line_text += char
+            current_line_buf.append(char)
+            current_line_len += len(char)
 
-            # 1. 句末标点
-            is_sentence_end = char in self.sentence_enders
-
-            # 2. 字符间隔停顿
-            is_pause_after = False
-            if i < len(chars) - 1:
-                gap_time = char_starts[i + 1] - char_ends[i]
-                is_pause_after = gap_time >= self.pause_threshold
+            # 1. 句末标点 / 2. 字符间隔停顿（已在 build_atoms 中预计算）
+            reason = hard_breaks[i]
 
             # 3. 长度控制
-            is_long = False
-            if not ignore_line_length:
+            if reason is None and not ignore_line_length:
                 # 逻辑：达到阈值且在分隔符处，或长度极其严重超标强制断开
-                is_long = (len(current_line_text) >= self.max_chars_per_line and char in self.delimiters) or \
-                          (len(current_line_text) >= self.max_chars_per_line * 1.5)
+                if (current_line_len >= max_chars and flags_get(char, 0) & _FLAG_DELIMITER) or \
+                   (current_line_len >= force_chars):
+                    reason = "length"
 
-            is_last_char = i == len(chars) - 1
-
-            # 确定分段原因
-            reason = None
-            if is_sentence_end: reason = "punct"
-            elif is_pause_after: reason = "pause"
-            elif is_long: reason = "length"
-            elif is_last_char: reason = "last"
+            if reason is None and i == last_index:
+                reason = "last"
 
             if reason:
-                clean_text = " ".join(current_line_text.strip().split())
+                clean_text = _squash_spaces("".join(current_line_buf))
                 if clean_text:
                     sentences.append({
                         "text": clean_text,
@@ -96,10 +287,15 @@ class SubtitleSegmentBuilder:
                         "end": char_ends[i],
                         "reason": reason,
                     })
-                current_line_text = ""
+                current_line_buf = []
+                current_line_len = 0
                 current_line_start = None
+        return sentences
 
-        # 合并处理：解决标点过碎
+    def _merge_short_sentences(self, sentences):
+        """
+        合并处理：解决标点过碎
+        """
         merged = []
         for seg in sentences:
             if not merged:
@@ -123,7 +319,7 @@ class SubtitleSegmentBuilder:
                         should_merge = True
 
             if should_merge:
-                prev["text"] = " ".join((prev["text"] + " " + seg["text"]).split())
+                prev["text"] = _squash_spaces(prev["text"] + " " + seg["text"])
                 prev["end"] = seg["end"]
                 # 合并后更新 reason，如果包含了 punct，则标记为 punct 防止继续被后续合并
                 if seg["reason"] == "punct":
@@ -139,9 +335,27 @@ class SubtitleSegmentBuilder:
         """
         词级分段模式
         """
+        return self._group_words(self._build_words(chars, char_starts, char_ends), words_per_line)
+
+    def _build_words(self, chars, char_starts, char_ends):
+        """
+        分词并合并数字、标点，得到词级分段的基础词列表
+        """
         words = CJKTokenizer.tokenize_by_cjk(chars, char_starts, char_ends)
         words = self._merge_numeric_with_adjacent(words)
-        processed_words = self._merge_punctuation_with_previous(words)
+        return self._merge_punctuation_with_previous(words)
+
+    def _group_words(self, processed_words, words_per_line):
+        """
+        按词数、句末标点与停顿将词分组为字幕（下方逐词循环为无 NumPy 时的回退实现）
+        """
+        if np is not None and processed_words:
+            return self._group_words_vectorized(processed_words, words_per_line)
+
+        ender_search = self._ender_pattern.search if self._ender_pattern is not None else None
+        pause_threshold = self.pause_threshold
+        smart_join = CJKTokenizer.smart_join
+        last_index = len(processed_words) - 1
 
         current_group = []
         segments = []
@@ -150,17 +364,17 @@ class SubtitleSegmentBuilder:
             current_group.append(word_obj)
 
             is_limit_reached = len(current_group) >= words_per_line
-            is_sentence_end = any(ender in word_obj["text"] for ender in self.sentence_enders)
+            is_sentence_end = ender_search is not None and ender_search(word_obj["text"]) is not None
             
             is_pause = False
-            if i < len(processed_words) - 1:
+            if i < last_index:
                 gap_time = processed_words[i + 1]["start"] - word_obj["end"]
-                is_pause = gap_time >= self.pause_threshold
+                is_pause = gap_time >= pause_threshold
             
-            is_last = i == len(processed_words) - 1
+            is_last = i == last_index
 
             if is_limit_reached or is_sentence_end or is_pause or is_last:
-                text_content = CJKTokenizer.smart_join(current_group)
+                text_content = smart_join(current_group)
                 if text_content:
                     segments.append({
                         "text": text_content,
@@ -170,6 +384,44 @@ class SubtitleSegmentBuilder:
                 current_group = []
         return segments
 
+    def _group_words_vectorized(self, processed_words, words_per_line):
+        """
+        用 NumPy 一次性计算停顿与句末标点断点，只在断点处切片分组。
+        词数上限在相邻硬断点之间按固定步长计算，不再逐词判断。
+        """
+        count = len(processed_words)
+        starts = np.fromiter((w["start"] for w in processed_words), dtype=np.float64, count=count)
+        ends = np.fromiter((w["end"] for w in processed_words), dtype=np.float64, count=count)
+
+        hard_mask = np.empty(count, dtype=bool)
+        hard_mask[:-1] = (starts[1:] - ends[:-1]) >= self.pause_threshold
+        hard_mask[-1] = True
+        if self._ender_pattern is not None:
+            ender_search = self._ender_pattern.search
+            hard_mask |= np.fromiter(
+                (ender_search(w["text"]) is not None for w in processed_words), dtype=bool, count=count
+            )
+
+        # 分组达到 words_per_line 个词即断开，等价于逐词判断 len(group) >= words_per_line
+        step = max(1, math.ceil(words_per_line))
+        smart_join = CJKTokenizer.smart_join
+        segments = []
+        first = 0
+        for hard in np.flatnonzero(hard_mask).tolist():
+            cuts = list(range(first + step - 1, hard, step))
+            cuts.append(hard)
+            for last in cuts:
+                group = processed_words[first:last + 1]
+                text_content = smart_join(group)
+                if text_content:
+                    segments.append({
+                        "text": text_content,
+                        "start": group[0]["start"],
+                        "end": group[-1]["end"],
+                    })
+                first = last + 1
+        return segments
+
     def _should_merge_short(self, text):
         """
         判断短句逻辑优化：增加字符长度维度
@@ -183,17 +435,33 @@ class SubtitleSegmentBuilder:
         标点不换行处理
         """
         if not words: return words
-        punctuation_chars = self.delimiters | self.sentence_enders
+        # 先一次性标记纯标点词；首个词前面没有可并入的词，始终单独成词
+        is_punct = [self._is_punctuation_only(word["text"]) for word in words]
+        is_punct[0] = False
+
+        # 单次前向遍历：每个非标点词连同其后连续的标点词一次性拼接输出
         result = []
-        for word in words:
-            is_punctuation = all(c in punctuation_chars for c in word["text"] if c.strip())
-            if is_punctuation and result:
-                result[-1]["text"] += word["text"]
-                result[-1]["end"] = word["end"]
-            else:
-                result.append(word)
+        count = len(words)
+        i = 0
+        while i < count:
+            word = words[i]
+            j = i + 1
+            while j < count and is_punct[j]:
+                j += 1
+            if j - i > 1:
+                word["text"] = "".join([w["text"] for w in words[i:j]])
+                word["end"] = words[j - 1]["end"]
+            result.append(word)
+            i = j
         return result
 
+    def _is_punctuation_only(self, text):
+        """
+        除空白外只包含分隔符/句末标点（纯空白或空串也视为标点）
+        """
+        leftover = set(text).difference(self._punctuation_chars)
+        return not leftover or "".join(leftover).isspace()
+
     def _merge_numeric_with_adjacent(self, words):
         """
         数字不换行处理
@@ -243,7 +511,7 @@ class SubtitleSegmentBuilder:
                 first = text[0]
                 if (first in punctuation_chars or first.isdigit()) and first not in "([{“‘":
                     prev = final[-1]
-                    prev["text"] = " ".join((prev["text"] + " " + text).split())
+                    prev["text"] = _squash_spaces(prev["text"] + " " + text)
                     prev["end"] = seg["end"]
                     continue
             final.append(seg)
@@ -7,6 +7,9 @@ SubtitleWriter：统一的 SRT 文件写入工具
 - 消除代码重复（原 create_srt 和 generate_translated_srt 中的写文件逻辑）
 """
 
+# 每累计多少条字幕写盘一次：大文件分块写入，避免整份内容常驻内存
+_WRITE_CHUNK_SEGMENTS = 1024
+
 
 class SubtitleWriter:
     """SRT 字幕文件写入工具"""
@@ -38,8 +41,10 @@ class SubtitleWriter:
                 pass
             return
 
+        format_time = SubtitleWriter._format_time
         try:
-            with open(filename, "w", encoding="utf-8") as f:
+            with open(filename, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+                parts = []
                 for idx, segment in enumerate(segments):
                     # 获取分段信息
                     text = segment.get("text", "").strip()
@@ -56,12 +61,14 @@ class SubtitleWriter:
                     if not text:
                         continue
 
-                    # 写入 SRT 条目
-                    f.write(f"{idx + 1}\n")
-                    f.write(
-                        f"{SubtitleWriter._format_time(start)} --> {SubtitleWriter._format_time(end)}\n"
-                    )
-                    f.write(f"{text}\n\n")
+                    # 拼接 SRT 条目，按块一次性写入
+                    parts.append(f"{idx + 1}\n{format_time(start)} --> {format_time(end)}\n{text}\n\n")
+                    if len(parts) >= _WRITE_CHUNK_SEGMENTS:
+                        f.write("".join(parts))
+                        parts.clear()
+
+                if parts:
+                    f.write("".join(parts))
         except IOError as e:
             raise IOError(f"无法写入 SRT 文件 {filename}: {str(e)}")
         except Exception as e:
@@ -83,9 +90,12 @@ class SubtitleWriter:
             '00:00:01,500'
             >>> SubtitleWriter._format_time(90.123)
             '00:01:30,123'
+            >>> SubtitleWriter._format_time(1.005)
+            '00:00:01,005'
         """
-        mils = int((seconds % 1) * 1000)
-        secs = int(seconds % 60)
-        mins = int((seconds / 60) % 60)
-        hours = int(seconds / 3600)
-        return f"{hours:02d}:{mins:02d}:{secs:02d},{mils:03d}"
+        # 先四舍五入到整毫秒再做整数 divmod；直接截断时 1.005 * 1000 = 1004.999... 会少 1ms
+        ms_total = round(seconds * 1000)
+        hours, ms_total = divmod(ms_total, 3_600_000)
+        mins, ms_total = divmod(ms_total, 60_000)
+        secs, mils = divmod(ms_total, 1000)
+        return "%02d:%02d:%02d,%03d" % (hours, mins, secs, mils)
@@ -0,0 +1,157 @@
+"""
+TranslationCache：翻译结果持久化缓存
+
+职责：
+- 以 (模型, 原文哈希) 为键，将翻译结果保存到本地 SQLite
+- 重复处理同一素材（调整分段、重跑失败批次等）时直接读取，跳过 API 请求
+- 超出容量时按最近使用时间淘汰旧条目
+
+注意：缓存读写失败只记录警告，不影响翻译流程。
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from ..logging_config import get_logger
+from ..utils import get_cache_dir
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    model TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    translation TEXT NOT NULL,
+    accessed INTEGER NOT NULL,
+    PRIMARY KEY (model, text_hash)
+) WITHOUT ROWID
+"""
+
+# 单条 SQL 中 IN (...) 的参数个数上限，低于 SQLite 默认的变量数限制
+_QUERY_CHUNK = 500
+
+
+def _text_hash(text):
+    """原文的 128 位 BLAKE2b 摘要，仅用作缓存键"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class TranslationCache:
+    """
+    基于 SQLite 的翻译缓存，可在多个翻译线程间共享
+    """
+
+    def __init__(self, path, max_entries=200_000):
+        """
+        Args:
+            path (str | Path): 数据库文件路径，":memory:" 表示仅内存
+            max_entries (int): 最多保留的条目数，超出后淘汰最久未使用的条目
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        """首次使用时再打开数据库，调用方需持有 _lock"""
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, model, texts):
+        """
+        批量查询缓存
+
+        Args:
+            model (str): 翻译模型名称
+            texts (Iterable[str]): 原文列表
+
+        Returns:
+            dict: {原文: 译文}，只包含命中的条目
+        """
+        by_hash = {_text_hash(t): t for t in texts}
+        if not by_hash:
+            return {}
+
+        found = {}
+        keys = list(by_hash)
+        with self._lock:
+            try:
+                conn = self._connect()
+                for i in range(0, len(keys), _QUERY_CHUNK):
+                    chunk = keys[i : i + _QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT text_hash, translation FROM translations WHERE model = ? AND text_hash IN ({placeholders})",
+                        (model, *chunk),
+                    )
+                    for text_hash, translation in rows:
+                        found[by_hash[bytes(text_hash)]] = translation
+                if found:
+                    now = int(time.time())
+                    with conn:
+                        conn.executemany(
+                            "UPDATE translations SET accessed = ? WHERE model = ? AND text_hash = ?",
+                            [(now, model, _text_hash(t)) for t in found],
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"读取翻译缓存失败: {e}")
+        return found
+
+    def put_many(self, model, pairs):
+        """
+        批量写入缓存
+
+        Args:
+            model (str): 翻译模型名称
+            pairs (Iterable[tuple[str, str]]): (原文, 译文) 列表
+        """
+        now = int(time.time())
+        rows = [(model, _text_hash(text), translation, now) for text, translation in pairs]
+        if not rows:
+            return
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)", rows)
+                    excess = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM translations WHERE (model, text_hash) IN "
+                            "(SELECT model, text_hash FROM translations ORDER BY accessed LIMIT ?)",
+                            (excess,),
+                        )
+            except sqlite3.Error as e:
+                logger.warning(f"写入翻译缓存失败: {e}")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_translation_cache():
+    """
+    返回进程内共享的默认翻译缓存（位于 get_cache_dir() 下）
+    """
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = TranslationCache(get_cache_dir() / "translations.sqlite3")
+        return _DEFAULT_CACHE
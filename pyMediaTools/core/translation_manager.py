@@ -9,36 +9,103 @@ TranslationManager：翻译服务管理器
 """
 
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from ..logging_config import get_logger
+from ..utils import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
 
+# 批次内每条文本的序号前缀，如 "3. Hello"
+_INDEX_PREFIX_RE = re.compile(r"\s*(\d+)\s*[\.:]\s*(.*)", re.S)
+
+# 数量不匹配时对半拆分重试；不超过该条数的批次不再拆分，直接逐条翻译
+_SPLIT_MIN_BATCH = 4
+
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_wait_seconds(value):
+    """
+    解析 Retry-After / x-ratelimit-reset-* 头部，返回秒数。
+    支持纯数字（秒）以及 Groq 的 "2m59.56s"、"7.66s"、"120ms" 格式，无法解析时返回 None。
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts or "".join(num + unit for num, unit in parts) != value:
+        return None
+    return sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+
+
 class TranslationManager:
     """
     翻译管理器，负责与 Groq API 交互并执行分段翻译
     """
 
-    def __init__(self, api_key=None, model="openai/gpt-oss-120b"):
+    def __init__(self, api_key=None, model="openai/gpt-oss-120b", cache=None):
         """
         初始化翻译管理器
 
         Args:
             api_key (str, optional): Groq API Key。如果为 None，尝试从环境变量 GROQ_API_KEY 读取
             model (str): 使用的模型名称，默认 "openai/gpt-oss-120b"
+            cache (TranslationCache, optional): 翻译结果缓存，为 None 时不使用缓存
 
         Examples:
             >>> tm = TranslationManager(api_key="xxx")
+            >>> tm = TranslationManager(api_key="xxx", cache=get_translation_cache())
             >>> tm = TranslationManager()  # 从环境变量读取 API Key
         """
         self.api_key = api_key or os.getenv("GROQ_API_KEY", "")
         self.model = model
+        self.cache = cache
         self.base_url = "https://api.groq.com/openai/v1/chat/completions"
         self.timeout = 45  # Increased timeout for batches
         self.batch_size = 20  # Number of segments per request
         self.max_retries = 3  # Max retries for rate limits
+        self.max_concurrency = 4  # Max batches in flight at once
+        self._session = self._create_session()
+        # 并发批次共享的限流冷却截止时间（time.monotonic），触发 429 后其他批次也会等待
+        self._rate_limit_lock = threading.Lock()
+        self._cooldown_until = 0.0
+        if not self.api_key:
+            # 未配置 API Key 时翻译必然跳过：构造时直接替换为空操作，调用时不再做任何分批准备
+            self.translate_segments = self._skip_translation
+
+    def _create_session(self):
+        """
+        创建复用 HTTPS 连接的会话，连接池大小与并发批次数一致，
+        避免每个批次都重新进行 TCP + TLS 握手。重试由 _request_with_retry 负责。
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrency,
+            pool_maxsize=self.max_concurrency,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """
+        释放连接池中的连接
+        """
+        self._session.close()
 
     def is_available(self):
         """
@@ -72,63 +139,110 @@ class TranslationManager:
             >>> translated[0]["text"]
             '你好'
         """
-        if not self.is_available():
-            logger.warning("未找到 Groq API Key，跳过翻译。请在 config.toml 中配置 [groq] api_key。")
-            return segments
-
         if not segments:
             return segments
 
-        logger.info(f"正在进行智能分批处理: {len(segments)} 个片段 (模型: {self.model})")
+        batches = [segments[i : i + self.batch_size] for i in range(0, len(segments), self.batch_size)]
+        workers = max(1, min(self.max_concurrency, len(batches)))
+        logger.info(f"正在进行智能分批处理: {len(segments)} 个片段, {len(batches)} 个批次, 并发 {workers} (模型: {self.model})")
+
+        # 各批次互相独立，I/O 期间释放 GIL，可并发请求；executor.map 按提交顺序返回，保证字幕顺序不变
+        if workers == 1:
+            results = [self._translate_segment_batch(batch, n) for n, batch in enumerate(batches, 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._translate_segment_batch, batches, range(1, len(batches) + 1)))
 
         translated_segments = []
-        for i in range(0, len(segments), self.batch_size):
-            batch = segments[i : i + self.batch_size]
-            # add numbering prefix to each segment text to help maintain alignment after translation
-            batch_texts = [f"{idx+1}. {s.get('text', '')}" for idx, s in enumerate(batch)]
-            
-            try:
-                translated_texts = self._translate_batch(batch_texts)
-                # parsed_texts will be reordered according to detected prefixes
-                reordered = [None] * len(batch)
-                for t in translated_texts:
-                    if t is None:
-                        continue
-                    # try to extract leading index
-                    import re
-                    m = re.match(r"\s*(\d+)\s*[\.:]\s*(.*)", t, re.S)
-                    if m:
-                        idx = int(m.group(1)) - 1
-                        txt = m.group(2).strip()
-                        if 0 <= idx < len(batch):
-                            reordered[idx] = txt
-                        else:
-                            # out of range, push to next available slot later
-                            reordered.append(txt)
-                    else:
-                        # no index found; will place sequentially
-                        for j in range(len(reordered)):
-                            if reordered[j] is None:
-                                reordered[j] = t.strip()
-                                break
-                # fill any missing translations with original text or empty string
+        for batch_result in results:
+            translated_segments.extend(batch_result)
+        return translated_segments
+
+    def _skip_translation(self, segments):
+        """
+        无 API Key 时 translate_segments 的替代实现：原样返回分段
+        """
+        logger.warning("未找到 Groq API Key，跳过翻译。请在 config.toml 中配置 [groq] api_key。")
+        return segments
+
+    def _translate_segment_batch(self, batch, batch_number):
+        """
+        翻译一个批次的分段，失败时返回原始分段
+
+        Args:
+            batch (list): 本批次的分段列表
+            batch_number (int): 批次序号（从 1 开始，仅用于日志）
+
+        Returns:
+            list: 与 batch 等长的翻译后分段列表
+        """
+        texts = [s.get("text", "") for s in batch]
+
+        try:
+            # 已缓存的原文直接取译文；重复的原文（"Thank you." 等）只翻译一次，空白文本不发送
+            translations = self.cache.get_many(self.model, texts) if self.cache is not None else {}
+            pending = [t for t in dict.fromkeys(texts) if t.strip() and t not in translations]
+            if pending:
+                fresh, aligned = self._translate_numbered(pending)
+                translations.update(zip(pending, fresh))
+                if self.cache is not None:
+                    # 只缓存按序号对齐的译文；按顺序兜底填入的结果可能错位，不能长期复用
+                    self.cache.put_many(
+                        self.model, [(src, t) for src, t, ok in zip(pending, fresh, aligned) if t and ok]
+                    )
+
+            translated_segments = []
+            for original_seg, text in zip(batch, texts):
+                updated_segment = original_seg.copy()
+                trans_text = translations.get(text)
+                if trans_text:
+                    updated_segment["text"] = trans_text
+                translated_segments.append(updated_segment)
+
+            logger.debug(f"已处理批次: {batch_number}, 集成 {len(batch)} 个片段 (实际请求 {len(pending)})")
+            return translated_segments
+        except Exception as e:
+            logger.error(f"批次翻译失败: {e}")
+            # Fallback to original segments if entire batch fails
+            return list(batch)
+
+    def _translate_numbered(self, texts):
+        """
+        为文本加序号前缀后批量翻译，并按返回的序号重新对齐
+
+        Returns:
+            tuple: (译文列表, 对齐标记列表)，均与 texts 等长；
+                   未能翻译的位置为 None，对齐标记表示该译文是否由返回的序号定位
+        """
+        # add numbering prefix to each segment text to help maintain alignment after translation
+        batch_texts = [f"{idx+1}. {t}" for idx, t in enumerate(texts)]
+
+        translated_texts = self._translate_batch(batch_texts)
+        # parsed_texts will be reordered according to detected prefixes
+        reordered = [None] * len(texts)
+        aligned = [False] * len(texts)
+        for t in translated_texts:
+            if t is None:
+                continue
+            # try to extract leading index
+            m = _INDEX_PREFIX_RE.match(t)
+            if m:
+                idx = int(m.group(1)) - 1
+                txt = m.group(2).strip()
+                if 0 <= idx < len(texts):
+                    # 同一位置被重复填入说明模型输出有误，保留译文但不视为已对齐
+                    aligned[idx] = reordered[idx] is None
+                    reordered[idx] = txt
+                else:
+                    # out of range, push to next available slot later
+                    reordered.append(txt)
+            else:
+                # no index found; will place sequentially
                 for j in range(len(reordered)):
                     if reordered[j] is None:
-                        reordered[j] = batch[j].get("text", "")
-
-                for original_seg, trans_text in zip(batch, reordered):
-                    updated_segment = original_seg.copy()
-                    if trans_text:
-                        updated_segment["text"] = trans_text
-                    translated_segments.append(updated_segment)
-                
-                logger.debug(f"已处理批次: {i // self.batch_size + 1}, 集成 {len(batch)} 个片段")
-            except Exception as e:
-                logger.error(f"批次翻译失败: {e}")
-                # Fallback to original segments if entire batch fails
-                translated_segments.extend(batch)
-
-        return translated_segments
+                        reordered[j] = t.strip()
+                        break
+        return reordered[:len(texts)], aligned
 
     def _translate_batch(self, texts):
         """
@@ -159,13 +273,14 @@ class TranslationManager:
             if len(translated_lines) > len(texts) and not translated_lines[-1]:
                 translated_lines.pop()
             
-            # If we still have a mismatch, log it
+            # 模型合并或丢失了分隔符：对半拆分后重试，小批次改为逐条翻译，避免整批静默未翻译。
+            # 最坏情况（每次都不匹配）约为 N + 2N/_SPLIT_MIN_BATCH 次请求，而非一直对半拆到单条的 2N-1 次
             if len(translated_lines) != len(texts):
-                logger.warning(f"翻译数量不匹配: 期望 {len(texts)}, 实际 {len(translated_lines)}")
-                if len(translated_lines) > len(texts):
-                    translated_lines = translated_lines[:len(texts)]
-                else:
-                    translated_lines.extend([None] * (len(texts) - len(translated_lines)))
+                logger.warning(f"翻译数量不匹配: 期望 {len(texts)}, 实际 {len(translated_lines)}，拆分批次重试")
+                if len(texts) <= _SPLIT_MIN_BATCH:
+                    return [self._translate_numbered_single(t) for t in texts]
+                mid = len(texts) // 2
+                return self._translate_batch(texts[:mid]) + self._translate_batch(texts[mid:])
             
             return translated_lines
         except Exception as e:
@@ -177,24 +292,26 @@ class TranslationManager:
         带重试逻辑的 API 请求
         """
         headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-        payload = {
+        body = json_dumps({
             "messages": [
                 {"role": "system", "content": system_content},
                 {"role": "user", "content": user_content},
             ],
             "model": self.model,
             "temperature": 0.3,
-        }
+        })
 
         retry_count = 0
         backoff_delay = 5  # Initial backoff in seconds
 
         while retry_count <= self.max_retries:
             try:
-                response = requests.post(self.base_url, json=payload, headers=headers, timeout=self.timeout)
+                self._wait_for_cooldown()
+                response = self._session.post(self.base_url, data=body, headers=headers, timeout=self.timeout)
+                self._note_rate_limit_headers(response.headers)
 
                 if response.status_code == 200:
-                    res_json = response.json()
+                    res_json = json_loads(response.content)
                     if "choices" in res_json and len(res_json["choices"]) > 0:
                         return res_json["choices"][0]["message"]["content"].strip()
                     return None
@@ -204,9 +321,13 @@ class TranslationManager:
                         logger.error("已达最大重试次数，仍产生 429 错误")
                         raise Exception("Rate limit exceeded and max retries reached")
                     
-                    wait_time = backoff_delay * (2 ** (retry_count - 1))
-                    logger.warning(f"触发 Groq 速率限制 (429)，将在 {wait_time} 秒后重试 ({retry_count}/{self.max_retries})...")
-                    time.sleep(wait_time)
+                    wait_time = _parse_wait_seconds(response.headers.get("Retry-After"))
+                    if wait_time is None:
+                        wait_time = backoff_delay * (2 ** (retry_count - 1))
+                    # 加入随机抖动，避免并发批次在同一时刻集中重试
+                    wait_time += random.uniform(0, wait_time * 0.25)
+                    logger.warning(f"触发 Groq 速率限制 (429)，将在 {wait_time:.1f} 秒后重试 ({retry_count}/{self.max_retries})...")
+                    self._extend_cooldown(wait_time)
                 else:
                     error_msg = f"Groq API Error: {response.status_code} - {response.text}"
                     logger.error(error_msg)
@@ -221,6 +342,33 @@ class TranslationManager:
         
         return None
 
+    def _wait_for_cooldown(self):
+        """
+        若处于限流冷却期，等待至冷却结束
+        """
+        with self._rate_limit_lock:
+            remaining = self._cooldown_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _extend_cooldown(self, seconds):
+        """
+        将共享冷却期延长到至少 seconds 秒之后
+        """
+        with self._rate_limit_lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    def _note_rate_limit_headers(self, headers):
+        """
+        根据 Groq 返回的 x-ratelimit-* 头部，在额度耗尽时提前进入冷却，
+        避免其余并发批次继续请求而触发 429
+        """
+        for kind in ("requests", "tokens"):
+            if headers.get(f"x-ratelimit-remaining-{kind}") == "0":
+                reset = _parse_wait_seconds(headers.get(f"x-ratelimit-reset-{kind}"))
+                if reset:
+                    self._extend_cooldown(reset)
+
     def _translate_single(self, text):
         """
         翻译单个文本片段
@@ -228,6 +376,16 @@ class TranslationManager:
         system_content = "You are a professional translator. Translate the following text into Simplified Chinese. Output ONLY the translated text, no explanations."
         return self._request_with_retry(system_content, text)
 
+    def _translate_numbered_single(self, text):
+        """
+        单独翻译一条带序号前缀（如 "3. Hello"）的文本，译文缺少序号时补回，保证后续按序号对齐
+        """
+        result = self._translate_single(text)
+        m = _INDEX_PREFIX_RE.match(text)
+        if result and m and not _INDEX_PREFIX_RE.match(result):
+            result = f"{m.group(1)}. {result}"
+        return result
+
     def set_model(self, model):
         """
         更改翻译模型
@@ -240,6 +398,17 @@ class TranslationManager:
         """
         self.model = model
 
+    def set_max_concurrency(self, max_concurrency):
+        """
+        设置同时进行的批次请求数
+
+        Args:
+            max_concurrency (int): 最大并发数，1 表示顺序执行
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._session.close()
+        self._session = self._create_session()
+
     def set_timeout(self, timeout):
         """
         设置单次请求超时
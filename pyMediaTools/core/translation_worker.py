@@ -14,6 +14,7 @@ from typing import List
 from PySide6.QtCore import QObject, Signal
 
 from .translation_manager import TranslationManager
+from .translation_cache import get_translation_cache
 from .whisper_transcription import _detect_cjk, SENTENCE_BOUNDARIES, TRANSLATE_TARGET_LANGUAGES
 
 
@@ -31,13 +32,15 @@ class TranslationWorker(QObject):
     def run(self):
         try:
             self.progress.emit("🌍 开始翻译...")
-            tm = TranslationManager(api_key=self.api_key)
-
-            grouped = self._group_segments_into_sentences(self.segments)
-            if self.target_lang == "zh":
-                translated = tm.translate_segments(grouped)
-            else:
-                translated = self._translate_to_other_language(grouped)
+            tm = TranslationManager(api_key=self.api_key, cache=get_translation_cache())
+            try:
+                grouped = self._group_segments_into_sentences(self.segments)
+                if self.target_lang == "zh":
+                    translated = tm.translate_segments(grouped)
+                else:
+                    translated = self._translate_to_other_language(tm, grouped)
+            finally:
+                tm.close()
 
             self.finished.emit(translated)
         except Exception as e:
@@ -72,8 +75,7 @@ class TranslationWorker(QObject):
         flush_group()
         return sentence_groups
 
-    def _translate_to_other_language(self, groups: list) -> list:
-        tm = TranslationManager(api_key=self.api_key)
+    def _translate_to_other_language(self, tm: TranslationManager, groups: list) -> list:
         translated_groups = []
         batch_size = 20
         lang_name = TRANSLATE_TARGET_LANGUAGES.get(self.target_lang, self.target_lang)
@@ -4,6 +4,7 @@
 import os
 import logging
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PySide6.QtCore import QThread, Signal
 import yt_dlp
@@ -11,6 +12,18 @@ from ..utils import get_ffmpeg_exe
 
 logger = logging.getLogger(__name__)
 
+# 同一下载项两次进度信号之间的最短间隔（秒），yt-dlp 的回调频率远高于界面所需
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# 速度格式化表：第 i 项对应 1024**i 量级，按位长度直接定位单位，避免逐级除法
+_SPEED_FORMATS = (
+    ("%.2fB", 1.0),
+    ("%.2fKiB", 1.0 / 1024),
+    ("%.2fMiB", 1.0 / 1024**2),
+    ("%.2fGiB", 1.0 / 1024**3),
+    ("%.2fTiB", 1.0 / 1024**4),
+)
+
 class YtDlpLogger:
     def debug(self, msg):
         # For yt-dlp, debug messages can be very verbose
@@ -81,6 +94,10 @@ class YtDlpDownloadWorker(QThread):
             self.concurrency = 4
         if self.concurrency < 1:
             self.concurrency = 1
+        # ui_index -> (完整路径, 文件名)；进度回调非常频繁，文件名只在路径变化时重新解析
+        self._name_cache = {}
+        # ui_index -> (上次发送时间, 百分比文本, 速度, 文件名)；只在显示内容变化时发送进度信号
+        self._last_progress = {}
 
 
     def _format_speed(self, bps: float) -> str:
@@ -92,12 +109,15 @@ class YtDlpDownloadWorker(QThread):
         except Exception:
             return '-'
 
-        units = ["B", "KiB", "MiB", "GiB", "TiB"]
-        idx = 0
-        while b >= 1024 and idx + 1 < len(units):
-            b /= 1024.0
-            idx += 1
-        return f"{b:.2f}{units[idx]}"
+        if not b >= 1024:
+            idx = 0
+        else:
+            try:
+                idx = min((int(b).bit_length() - 1) // 10, len(_SPEED_FORMATS) - 1)
+            except OverflowError:
+                idx = len(_SPEED_FORMATS) - 1
+        fmt, scale = _SPEED_FORMATS[idx]
+        return fmt % (b * scale)
 
     def _parse_human_speed(self, s: str) -> float | None:
         """解析“1.35MiB/s”或“512.3KiB/s”等字符串，并以浮点数或 None 的形式返回字节/秒。"""
@@ -309,9 +329,20 @@ class YtDlpDownloadWorker(QThread):
                 except Exception:
                     percent = 0
 
+            # 限流：距上次发送不足 PROGRESS_EMIT_INTERVAL 时直接跳过（100% 除外）
+            now = time.monotonic()
+            last = self._last_progress.get(ui_index)
+            if last is not None and percent < 100 and now - last[0] < PROGRESS_EMIT_INTERVAL:
+                return
+
             # Calculate overall progress
             overall = ((item_idx + (percent / 100.0)) / self.total_files) * 100
-            filename = os.path.basename(d.get('filename', 'Unknown'))
+            path = d.get('filename', 'Unknown')
+            cached = self._name_cache.get(ui_index)
+            if cached is None or cached[0] != path:
+                cached = (path, os.path.basename(path))
+                self._name_cache[ui_index] = cached
+            filename = cached[1]
 
             # Normalize speed into a short value like '1.35MiB' (no '/s')
             speed_val = None
@@ -329,6 +360,12 @@ class YtDlpDownloadWorker(QThread):
             if speed_val is None or speed_val == '-':
                 speed_val = '-'
 
+            # 只发送增量：界面显示的百分比（保留一位小数）、速度和文件名都没变时不再跨线程发信号
+            shown = (f"{percent:.1f}", speed_val, filename)
+            if last is not None and last[1:] == shown:
+                return
+            self._last_progress[ui_index] = (now,) + shown
+
             self.progress.emit({
                 'overall_percent': overall,
                 'current_percent': percent,
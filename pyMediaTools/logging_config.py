@@ -1,12 +1,20 @@
 """
 日志配置模块
 """
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from .utils import get_base_dir
 
+# 业务线程只把日志记录放入队列（O(1)），文件写入由后台 QueueListener 线程完成
+_LOG_QUEUE = queue.SimpleQueue()
+_QUEUE_HANDLER = QueueHandler(_LOG_QUEUE)
+_QUEUE_LISTENER = None
+
 
 def setup_logging(log_level=logging.INFO, filename="pyMediaConvert.log"):
+    global _QUEUE_LISTENER
     base = get_base_dir()
     log_path = base / filename
 
@@ -14,13 +22,21 @@ def setup_logging(log_level=logging.INFO, filename="pyMediaConvert.log"):
     logger.setLevel(log_level)
 
     # avoid duplicate handlers
-    if any(isinstance(h, RotatingFileHandler) and h.baseFilename == str(log_path) for h in logger.handlers):
+    file_handlers = _QUEUE_LISTENER.handlers if _QUEUE_LISTENER is not None else ()
+    if any(isinstance(h, RotatingFileHandler) and h.baseFilename == str(log_path) for h in file_handlers):
         return logger
 
     handler = RotatingFileHandler(str(log_path), maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8')
     fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
     handler.setFormatter(fmt)
-    logger.addHandler(handler)
+
+    if _QUEUE_HANDLER not in logger.handlers:
+        logger.addHandler(_QUEUE_HANDLER)
+    # 监听器的处理器列表不可变，新增日志文件时以完整列表重建
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+    _QUEUE_LISTENER = QueueListener(_LOG_QUEUE, *file_handlers, handler, respect_handler_level=True)
+    _QUEUE_LISTENER.start()
 
     # 注册全局异常钩子，确保未捕获的异常能写入日志
     import sys
@@ -35,6 +51,21 @@ def setup_logging(log_level=logging.INFO, filename="pyMediaConvert.log"):
     return logger
 
 
+def shutdown_logging():
+    """停止后台日志线程并写出队列中剩余的记录（可重复调用，退出时自动调用）"""
+    global _QUEUE_LISTENER
+    if _QUEUE_LISTENER is None:
+        return
+    logging.getLogger().removeHandler(_QUEUE_HANDLER)
+    _QUEUE_LISTENER.stop()
+    for handler in _QUEUE_LISTENER.handlers:
+        handler.close()
+    _QUEUE_LISTENER = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str):
     logger = logging.getLogger(name)
     if not logger.handlers:
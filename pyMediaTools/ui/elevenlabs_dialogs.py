@@ -1,9 +1,11 @@
+from functools import partial
+
 from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, 
                                QComboBox, QSlider, QGroupBox, QSizePolicy, 
                                QCheckBox, QTabWidget, QScrollArea, QFrame,
                                QDialog, QDialogButtonBox, QGridLayout, QWidget,
                                QLineEdit, QPushButton, QMessageBox, QFileDialog, QInputDialog)
-from PySide6.QtCore import Qt, QSettings, QUrl
+from PySide6.QtCore import Qt, QSettings, QUrl, QTimer
 from PySide6.QtGui import QFont
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
@@ -12,6 +14,14 @@ from ..core.elevenlabs import (LibrarySearchWorker, LibraryAddWorker)
 
 class VoiceSettingsDialog(QDialog):
     """语音设定对话框"""
+    # 参数滑块：(属性名, 标签, 取值范围, 数值显示格式, 显示前的除数, 所需模型功能)
+    _SLIDER_SPECS = (
+        ('stability', "稳定性:", (0, 100), "{:.0f}%", 1, None),
+        ('similarity', "相似度提升:", (0, 100), "{:.0f}%", 1, None),
+        ('style', "风格:", (0, 100), "{:.0f}%", 1, 'can_use_style'),
+        ('speed', "速度:", (70, 120), "{:.2f}", 100, None),
+    )
+
     def __init__(self, parent=None, model_features=None, model_info=None, available_languages=None):
         super().__init__(parent)
         self.setWindowTitle("语音设定")
@@ -31,8 +41,28 @@ class VoiceSettingsDialog(QDialog):
         self.model_info = model_info or {}
         self.available_languages = available_languages or []
         
+        # 拖动滑块时待刷新的数值标签 {label: text}，由定时器合并为约每帧一次
+        self._pending_labels = {}
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(16)
+        self._label_timer.timeout.connect(self._flush_labels)
+        
         self.setup_ui()
     
+    def _on_slider_changed(self, label, fmt, divisor, value):
+        self._schedule_label(label, fmt.format(value / divisor))
+    
+    def _schedule_label(self, label, text):
+        self._pending_labels[label] = text
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+    
+    def _flush_labels(self):
+        pending, self._pending_labels = self._pending_labels, {}
+        for label, text in pending.items():
+            label.setText(text)
+    
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -45,55 +75,22 @@ class VoiceSettingsDialog(QDialog):
         grid_layout = QGridLayout()
         grid_layout.setSpacing(10)
         
-        # Stability
-        stability_label = QLabel("稳定性:")
-        self.slider_stability = QSlider(Qt.Horizontal)
-        self.slider_stability.setRange(0, 100)
-        self.slider_stability.setValue(self.stability)
-        self.lbl_stability_value = QLabel(f"{self.stability}%")
-        self.slider_stability.valueChanged.connect(lambda val: self.lbl_stability_value.setText(f"{val}%"))
-        grid_layout.addWidget(stability_label, 0, 0)
-        grid_layout.addWidget(self.slider_stability, 0, 1)
-        grid_layout.addWidget(self.lbl_stability_value, 0, 2)
-        
-        # Similarity
-        similarity_label = QLabel("相似度提升:")
-        self.slider_similarity = QSlider(Qt.Horizontal)
-        self.slider_similarity.setRange(0, 100)
-        self.slider_similarity.setValue(self.similarity)
-        self.lbl_similarity_value = QLabel(f"{self.similarity}%")
-        self.slider_similarity.valueChanged.connect(lambda val: self.lbl_similarity_value.setText(f"{val}%"))
-        grid_layout.addWidget(similarity_label, 1, 0)
-        grid_layout.addWidget(self.slider_similarity, 1, 1)
-        grid_layout.addWidget(self.lbl_similarity_value, 1, 2)
-        
-        # Style
-        style_label = QLabel("风格:")
-        self.slider_style = QSlider(Qt.Horizontal)
-        self.slider_style.setRange(0, 100)
-        self.slider_style.setValue(self.style)
-        self.lbl_style_value = QLabel(f"{self.style}%")
-        self.slider_style.valueChanged.connect(lambda val: self.lbl_style_value.setText(f"{val}%"))
-        
-        can_use_style = self.model_features.get('can_use_style', True)
-        self.slider_style.setEnabled(can_use_style)
-        style_label.setEnabled(can_use_style)
-        self.lbl_style_value.setEnabled(can_use_style)
-        
-        grid_layout.addWidget(style_label, 2, 0)
-        grid_layout.addWidget(self.slider_style, 2, 1)
-        grid_layout.addWidget(self.lbl_style_value, 2, 2)
-        
-        # Speed
-        speed_label = QLabel("速度:")
-        self.slider_speed = QSlider(Qt.Horizontal)
-        self.slider_speed.setRange(70, 120)
-        self.slider_speed.setValue(self.speed)
-        self.lbl_speed_value = QLabel(f"{self.speed/100:.2f}")
-        self.slider_speed.valueChanged.connect(lambda val: self.lbl_speed_value.setText(f"{val/100:.2f}"))
-        grid_layout.addWidget(speed_label, 3, 0)
-        grid_layout.addWidget(self.slider_speed, 3, 1)
-        grid_layout.addWidget(self.lbl_speed_value, 3, 2)
+        for row, (attr, text, value_range, fmt, divisor, feature) in enumerate(self._SLIDER_SPECS):
+            name_label = QLabel(text)
+            slider = QSlider(Qt.Horizontal)
+            slider.setRange(*value_range)
+            slider.setValue(getattr(self, attr))
+            value_label = QLabel(fmt.format(getattr(self, attr) / divisor))
+            slider.valueChanged.connect(partial(self._on_slider_changed, value_label, fmt, divisor))
+            if feature is not None:
+                enabled = self.model_features.get(feature, True)
+                for widget in (name_label, slider, value_label):
+                    widget.setEnabled(enabled)
+            setattr(self, f"slider_{attr}", slider)
+            setattr(self, f"lbl_{attr}_value", value_label)
+            grid_layout.addWidget(name_label, row, 0)
+            grid_layout.addWidget(slider, row, 1)
+            grid_layout.addWidget(value_label, row, 2)
         
         layout.addLayout(grid_layout)
         
@@ -110,24 +107,21 @@ class VoiceSettingsDialog(QDialog):
         self.combo_language = QComboBox()
         self.combo_language.addItem("自动检测", None)
         if self.available_languages:
-            for name, code in self.available_languages:
-                self.combo_language.addItem(name, code)
+            languages = self.available_languages
         else:
             from ..core.elevenlabs import LANGUAGE_CODES
-            for code, name in LANGUAGE_CODES.items():
-                self.combo_language.addItem(name, code)
+            languages = [(name, code) for code, name in LANGUAGE_CODES.items()]
 
+        # 先按模型支持的语言过滤再添加，不必把全部语言加入下拉框后再逐项删除
         langs = self.model_info.get('languages', [])
         if langs:
             supported_ids = set()
             for lang in langs:
                 lang_id = lang.get('language_id') if isinstance(lang, dict) else lang
                 supported_ids.add(lang_id)
-            for i in range(self.combo_language.count()-1, -1, -1):
-                data = self.combo_language.itemData(i)
-                if data is None: continue
-                if data not in supported_ids:
-                    self.combo_language.removeItem(i)
+            languages = [(name, code) for name, code in languages if code is None or code in supported_ids]
+        for name, code in languages:
+            self.combo_language.addItem(name, code)
         
         speaker_lang_layout.addWidget(language_label)
         speaker_lang_layout.addWidget(self.combo_language, 1)
@@ -179,7 +173,7 @@ class VoiceSettingsDialog(QDialog):
 
 class SubtitleSettingsDialog(QDialog):
     """字幕设置对话框 - 整合 Groq 配置和 XML 样式设置"""
-    def __init__(self, parent=None, xml_styles=None, video_settings=None, groq_settings=None):
+    def __init__(self, parent=None, xml_styles=None, video_settings=None, groq_settings=None, preview_label=None):
         super().__init__(parent)
         self.setWindowTitle("字幕设置")
         self.setModal(True)
@@ -190,7 +184,12 @@ class SubtitleSettingsDialog(QDialog):
         self.video_settings = video_settings or {}
         self.groq_settings = groq_settings or {'api_key': '', 'model': 'openai/gpt-oss-120b'}
         
-        self.groq_qsettings = QSettings("pyMediaTools", "Groq")
+        # 复用父控件已打开的 Groq QSettings，避免每次打开对话框都重新构造
+        self.groq_qsettings = getattr(parent, 'groq_qsettings', None)
+        if self.groq_qsettings is None:
+            self.groq_qsettings = QSettings("pyMediaTools", "Groq")
+        # 调用方传入的预览标签在对话框打开期间借用，关闭时归还，不随对话框销毁
+        self._shared_preview_label = preview_label
         
         self.setup_ui()
     
@@ -232,24 +231,24 @@ class SubtitleSettingsDialog(QDialog):
         self.tabs.addTab(self.general_tab, "常规设置")
         
         # Style Tabs (Source, Translate, Highlight)
+        # 样式面板（含枚举系统字体的 QFontComboBox）在首次切换到对应 Tab 时才构建
+        self._style_scrolls = {}
         if self.parent_widget and hasattr(self.parent_widget, 'create_style_settings_panel'):
-            def wrap_with_scroll(widget):
+            for style_type, title in (('source', "原文样式"), ('translate', "翻译样式"), ('highlight', "高亮样式")):
                 scroll = QScrollArea()
                 scroll.setWidgetResizable(True)
                 scroll.setFrameShape(QFrame.NoFrame)
-                scroll.setWidget(widget)
-                return scroll
-
-            self.tabs.addTab(wrap_with_scroll(self.parent_widget.create_style_settings_panel('source')), "原文样式")
-            self.tabs.addTab(wrap_with_scroll(self.parent_widget.create_style_settings_panel('translate')), "翻译样式")
-            self.tabs.addTab(wrap_with_scroll(self.parent_widget.create_style_settings_panel('highlight')), "高亮样式")
+                self._style_scrolls[self.tabs.addTab(scroll, title)] = (style_type, scroll)
         
         self.tabs.currentChanged.connect(self.on_tab_changed)
         layout.addWidget(self.tabs)
         
         self.preview_group = QGroupBox("样式预览")
         preview_layout = QVBoxLayout(self.preview_group)
-        self.dialog_preview_label = SubtitlePreviewLabel()
+        if self._shared_preview_label is not None:
+            self.dialog_preview_label = self._shared_preview_label
+        else:
+            self.dialog_preview_label = SubtitlePreviewLabel()
         preview_layout.addWidget(self.dialog_preview_label)
         layout.addWidget(self.preview_group)
         
@@ -261,14 +260,27 @@ class SubtitleSettingsDialog(QDialog):
         layout.addWidget(button_box)
 
     def on_tab_changed(self, index):
+        pending = self._style_scrolls.pop(index, None)
+        if pending is not None:
+            style_type, scroll = pending
+            scroll.setWidget(self.parent_widget.create_style_settings_panel(style_type))
         self.preview_group.setVisible(index > 0)
         if self.parent_widget and hasattr(self.parent_widget, 'update_preview'):
             self.parent_widget.update_preview()
             
+    def done(self, result):
+        if self._shared_preview_label is not None:
+            self._shared_preview_label.setParent(None)
+        super().done(result)
+
     def save_and_accept(self):
-        # Save Groq settings to QSettings
-        self.groq_qsettings.setValue("api_key", self.txt_api_key.text().strip())
-        self.groq_qsettings.setValue("model", self.txt_groq_model.text().strip())
+        # Save Groq settings to QSettings（同步更新内存中的 groq_settings，调用方无需重新读取）
+        self.groq_settings.update(
+            api_key=self.txt_api_key.text().strip(),
+            model=self.txt_groq_model.text().strip(),
+        )
+        self.groq_qsettings.setValue("api_key", self.groq_settings['api_key'])
+        self.groq_qsettings.setValue("model", self.groq_settings['model'])
         self.accept()
 
 
@@ -1,17 +1,19 @@
 import os
 import datetime
-import uuid
+import secrets
+from collections import OrderedDict
+from functools import lru_cache
 import re
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                                QPushButton, QTextEdit, QComboBox, QMessageBox, QProgressBar, QFileDialog, QSlider,
                                QGroupBox, QSizePolicy, QSpinBox, QCheckBox, QTabWidget, QScrollArea, QFrame,
                                QFontComboBox, QColorDialog, QDoubleSpinBox, QGridLayout, QDialog, QDialogButtonBox, QInputDialog)
-from PySide6.QtCore import Qt, QUrl, QSettings, QTimer, QSize, QRectF, QMimeData, QPoint
-from PySide6.QtGui import QFont, QColor, QPainter, QPainterPath, QPen, QBrush, QFontMetrics, QDrag, QTextCharFormat, QSyntaxHighlighter
+from PySide6.QtCore import Qt, QUrl, QSettings, QTimer, QSize, QRectF, QMimeData, QPoint, QBuffer, QByteArray
+from PySide6.QtGui import QFont, QColor, QPainter, QPainterPath, QPen, QBrush, QFontMetrics, QDrag, QTextCharFormat, QSyntaxHighlighter, QStandardItem
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
-from ..core.elevenlabs import (QuotaWorker, TTSWorker, SFXWorker, VoiceListWorker, 
-                               ModelListWorker, LibrarySearchWorker, LibraryAddWorker)
+from ..core.elevenlabs import (QuotaWorker, TTSWorker, SFXWorker, InitLoadWorker,
+                               PreviewFetchWorker, LibrarySearchWorker, LibraryAddWorker)
 from ..core.groq_analysis import EmotionAnalysisWorker
 from ..utils import load_project_config
 from .styles import apply_common_style
@@ -26,6 +28,24 @@ from .elevenlabs_dialogs import (VoiceSettingsDialog, SubtitleSettingsDialog,
 
 logger = get_logger(__name__)
 
+# 内存中最多保留的试听样本数
+PREVIEW_CACHE_SIZE = 16
+
+# 文件/目录选择框改用 Qt 自带对话框，不读取自定义图标、不解析符号链接，慢速磁盘/网络共享上打开更快；
+# DontUseCustomDirectoryIcons 只对 Qt 自带对话框生效，须与 DontUseNativeDialog 一起使用
+_FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseNativeDialog | QFileDialog.Option.DontUseCustomDirectoryIcons
+                        | QFileDialog.Option.DontResolveSymlinks)
+
+
+@lru_cache(256)
+def _color_button_css(rgb):
+    """
+    颜色按钮的样式表字符串，按 0~1 浮点 (r, g, b) 缓存，命中时无需再换算到 0~255
+    QColor.name() 不含透明度，因此 alpha 不参与缓存键
+    """
+    r, g, b = (int(c * 255) for c in rgb)
+    return f"background-color: {QColor(r, g, b).name()}; border-radius: 4px;"
+
 
 
 
@@ -37,6 +57,16 @@ class ElevenLabsWidget(QWidget):
         self.player = QMediaPlayer()
         self.audio_output = QAudioOutput()
         self.player.setAudioOutput(self.audio_output)
+        # 试听样本缓存 {preview_url: bytes}，来回切换声音时不再重复下载
+        self._preview_cache = OrderedDict()
+        self._preview_pending_url = None
+        # 快速切换时前一次下载可能仍在进行，运行中的线程需保留引用，否则被回收时会中止进程
+        self._preview_workers = set()
+        self._preview_buffer = None
+        # 样式预览刷新标记：同一轮事件循环内的多次样式修改只重绘一次
+        self._preview_dirty = False
+        # 样式颜色选择框，首次取色时创建并在之后复用
+        self._color_dialog = None
         
         # ⭐ 新增：存储从API获取的模型信息
         self.models_info = {}  # { model_id: {model_data} }
@@ -60,7 +90,7 @@ class ElevenLabsWidget(QWidget):
                 'lineSpacing': 0,
                 'pos': -45,
                 'shadowColor': (0.0, 0.0, 0.0, 0.5),
-                'shadowOffset': (2, 2),
+                'shadowOffset': [2, 2],
                 'useShadow': True,
                 'backgroundColor': (0.0, 0.0, 0.0, 0.0),
                 'useBackground': False,
@@ -79,7 +109,7 @@ class ElevenLabsWidget(QWidget):
                 'lineSpacing': 0,
                 'pos': -38,
                 'shadowColor': (0.0, 0.0, 0.0, 0.5),
-                'shadowOffset': (2, 2),
+                'shadowOffset': [2, 2],
                 'useShadow': True,
                 'backgroundColor': (0.0, 0.0, 0.0, 0.0),
                 'useBackground': True,
@@ -98,7 +128,7 @@ class ElevenLabsWidget(QWidget):
                 'lineSpacing': 0,
                 'pos': -45,
                 'shadowColor': (0.0, 0.0, 0.0, 0.5),
-                'shadowOffset': (2, 2),
+                'shadowOffset': [2, 2],
                 'useShadow': True,
                 'backgroundColor': (0.0, 0.0, 0.0, 0.0),
                 'useBackground': False,
@@ -114,6 +144,8 @@ class ElevenLabsWidget(QWidget):
             'srt_pause_threshold': 0.2,  # 停顿阈值
             'srt_max_chars': 40,         # 单行最大字符数
         }
+        # 当前分辨率预设的横屏尺寸，切换竖屏时只需交换宽高
+        self._base_wh = self._RES_PRESETS[0]
         
         # 语音设定 (默认值)
         self.voice_settings = {
@@ -124,11 +156,11 @@ class ElevenLabsWidget(QWidget):
             'speed': 1.0
         }
         
-        # Groq 设定 (默认值)
-        groq_qsettings = QSettings("pyMediaTools", "Groq")
+        # Groq 设定 (默认值)；QSettings 实例保留给字幕设置对话框复用，启动后只读这一次
+        self.groq_qsettings = QSettings("pyMediaTools", "Groq")
         self.groq_settings = {
-            'api_key': groq_qsettings.value("api_key", ""),
-            'model': groq_qsettings.value("model", "openai/gpt-oss-120b")
+            'api_key': self.groq_qsettings.value("api_key", ""),
+            'model': self.groq_qsettings.value("model", "openai/gpt-oss-120b")
         }
         
         # 尝试从 config.toml 加载默认样式配置
@@ -137,15 +169,32 @@ class ElevenLabsWidget(QWidget):
             for key, val in cfg['xml_styles'].items():
                 if key in self.xml_styles and isinstance(val, dict):
                     self.xml_styles[key].update(val)
+        # 阴影偏移由 update_shadow_offset 原地修改，需持有独立的列表，不能与缓存的配置共用
+        for style in self.xml_styles.values():
+            style['shadowOffset'] = list(style['shadowOffset'])
         
         # 创建预览标签（用于对话框）
         self.preview_label = SubtitlePreviewLabel()
         self.active_subtitle_dialog = None
         
+        # SFX 面板与首次加载声音列表推迟到控件第一次显示时
+        self._initialized = False
+
         self.setup_ui()
         self.apply_styles()
-        
-        # 1. 程序启动时如有读取到api自动刷新
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._initialized:
+            return
+        self._initialized = True
+        self.tabs_widget.addTab(self._build_sfx_panel(), "🎵 音效生成 (SFX)")
+
+        # 推迟到事件循环的下一轮，先完成首次绘制再进入忙碌状态
+        QTimer.singleShot(0, self._initial_load)
+
+    def _initial_load(self):
+        # 1. 首次显示时如有读取到api自动刷新
         #     仅在存在非空 API Key 时执行，并且使用 silent 模式避免
         #     因无效/失效 Key 或网络问题而弹出错误对话框。
         if self.key_input.text().strip():
@@ -200,6 +249,8 @@ class ElevenLabsWidget(QWidget):
         self.quota_label = QLabel("额度使用情况:")
         self.quota_bar = QProgressBar()
         self.quota_bar.setTextVisible(False) # 扁平化，不显示文字在条上
+        # 额度条当前是否为告警红色；只有状态切换时才替换样式表
+        self._quota_danger = False
         self.quota_text_val = QLabel("-- / --")
         
         quota_layout.addWidget(self.quota_label)
@@ -350,63 +401,17 @@ class ElevenLabsWidget(QWidget):
         tts_action_layout.addWidget(self.btn_tts_generate)
         tts_inner_layout.addLayout(tts_action_layout)
 
-        # --- SFX 区域 ---
-        sfx_group = QWidget()
-        sfx_inner_layout = QVBoxLayout(sfx_group)
-        sfx_inner_layout.setContentsMargins(10, 15, 10, 10)
-        sfx_inner_layout.setSpacing(10)
-
-        # 提示词与时长
-        sfx_input_layout = QHBoxLayout()
-        self.sfx_prompt_input = QTextEdit()
-        self.sfx_prompt_input.setPlaceholderText("描述音效，例如: footsteps on wood floor...")
-        
-        sfx_ctrl_layout = QVBoxLayout()
-        self.sfx_duration_input = QSpinBox()
-        self.sfx_duration_input.setRange(1, 22) # ElevenLabs 通常限制较短
-        self.sfx_duration_input.setValue(5)
-        self.sfx_duration_input.setSuffix(" 秒")
-        sfx_ctrl_layout.addWidget(QLabel("时长:"))
-        sfx_ctrl_layout.addWidget(self.sfx_duration_input)
-        sfx_ctrl_layout.addStretch()
-
-        sfx_input_layout.addWidget(self.sfx_prompt_input, 1)
-        sfx_input_layout.addLayout(sfx_ctrl_layout)
-        sfx_inner_layout.addLayout(sfx_input_layout)
-
-        # 保存与生成
-        sfx_action_layout = QHBoxLayout()
-        self.sfx_save_input = QLineEdit(self._generate_filename("sfx"))
-        self.btn_sfx_browse = QPushButton("...")
-        self.btn_sfx_browse.setFixedWidth(40)
-        self.btn_sfx_browse.clicked.connect(lambda: self.browse_save_path(self.sfx_save_input, "Audio (*.mp3)"))
-        self.btn_sfx_default = QPushButton("默认路径")
-        self.btn_sfx_default.setFixedWidth(110)
-        self.btn_sfx_default.clicked.connect(lambda: self.choose_default_save_path(self.sfx_save_input))
-        
-        self.btn_sfx_generate = QPushButton("生成音效")
-        self.btn_sfx_generate.setObjectName("PrimaryButton")
-        self.btn_sfx_generate.clicked.connect(self.generate_sfx_audio)
-
-        sfx_action_layout.addWidget(QLabel("保存至:"))
-        sfx_action_layout.addWidget(self.sfx_save_input)
-        sfx_action_layout.addWidget(self.btn_sfx_browse)
-        sfx_action_layout.addWidget(self.btn_sfx_default)
-        sfx_action_layout.addWidget(self.btn_sfx_generate)
-        sfx_inner_layout.addLayout(sfx_action_layout)
-
         # 如果存在已保存的默认目录，则填充保存路径输入框以便一键生成
         default_dir = self.settings.value("default_save_path", "")
         if default_dir:
             try:
                 self.tts_save_input.setText(os.path.join(default_dir, self._generate_filename("tts")))
-                self.sfx_save_input.setText(os.path.join(default_dir, self._generate_filename("sfx")))
             except Exception:
                 pass
         
-        # 将两个功能区添加到 Tab
+        # SFX 功能区在首次显示时再构建（见 showEvent）
         tabs_widget.addTab(tts_group, "🗣️ 文本转语音 (TTS)")
-        tabs_widget.addTab(sfx_group, "🎵 音效生成 (SFX)")
+        self.tabs_widget = tabs_widget
 
         main_layout.addWidget(tabs_widget)
 
@@ -446,21 +451,30 @@ class ElevenLabsWidget(QWidget):
         bottom_layout.addWidget(self.lbl_status, 1)
         main_layout.addWidget(bottom_panel)
         
-        # 定时器用于平滑更新进度 (50ms = 20fps)
-        self.update_timer = QTimer(self)
-        self.update_timer.setInterval(50)
-        self.update_timer.timeout.connect(self.update_ui_from_player)
-        
         self.is_seeking = False
         self.updating_slider = False
+        # 上次刷新时滑块所在像素与显示的秒数，二者都未变化时跳过重绘
+        self._last_slider_px = -1
+        self._last_time_sec = -1
+        self._slider_px_range = 1
+        self._last_fmt_sec = 0
+        self._last_fmt_str = "00:00"
+        # 拖动滑块时时间标签最多每 33ms 刷新一次
+        self._pending_drag_ms = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(33)
+        self._drag_timer.timeout.connect(self._flush_drag_label)
 
         # 连接播放器信号
         self.player.durationChanged.connect(self.on_duration_changed)
         self.player.mediaStatusChanged.connect(self.on_media_status_changed)
         self.player.playbackStateChanged.connect(self.on_playback_state_changed)
+        # 进度由播放器自身的 positionChanged 驱动，不再轮询 position()
+        self.player.positionChanged.connect(self._on_position_changed)
 
     def _generate_filename(self, prefix):
-        return f"{prefix}_{datetime.date.today()}_{str(uuid.uuid4())[:4]}.mp3"
+        return f"{prefix}_{datetime.date.today().isoformat()}_{secrets.token_hex(2)}.mp3"
 
     def browse_save_path(self, line_edit, filter_str):
         initial_path = line_edit.text()
@@ -470,7 +484,7 @@ class ElevenLabsWidget(QWidget):
             if default_dir:
                 # 补一个默认文件名
                 initial_path = os.path.join(default_dir, self._generate_filename("tts"))
-        fname, _ = QFileDialog.getSaveFileName(self, "选择保存路径", initial_path, filter_str)
+        fname, _ = QFileDialog.getSaveFileName(self, "选择保存路径", initial_path, filter_str, options=_FILE_DIALOG_OPTIONS)
         if fname:
             line_edit.setText(fname)
 
@@ -505,25 +519,21 @@ class ElevenLabsWidget(QWidget):
         # 根据 show_errors 决定是否在 on_error 中弹窗
         self._suppress_errors = not show_errors
         
-        # 同时加载模型列表和声音列表
-        self.model_worker = ModelListWorker(api_key)
-        self.model_worker.finished.connect(self.on_models_loaded)
-        self.model_worker.error.connect(self.on_error)
-        
-        self.voice_worker = VoiceListWorker(api_key)
-        self.voice_worker.finished.connect(self.on_voices_loaded)
-        self.voice_worker.error.connect(self.on_error)
-        
-        # 启动两个 worker
-        self.model_worker.start()
-        self.voice_worker.start()
-        
-        # 一并刷新额度，传递 show_errors 标识
-        self.refresh_quota_only(api_key, show_errors=show_errors)
+        # 模型列表、声音列表和额度由同一个 worker 依次加载，复用同一条连接
+        self.init_worker = InitLoadWorker(api_key)
+        self.init_worker.models_loaded.connect(self.on_models_loaded)
+        self.init_worker.voices_loaded.connect(self.on_voices_loaded)
+        self.init_worker.error.connect(self.on_error)
+        self.init_worker.quota_info.connect(self.on_quota_loaded)
+        self._connect_quota_error(self.init_worker.quota_error, show_errors)
+        self.init_worker.start()
 
     def choose_default_save_path(self, line_edit):
         """选择一个默认保存目录，并把当前行编辑框的路径设为该目录下的默认文件名。"""
-        directory = QFileDialog.getExistingDirectory(self, "选择默认保存目录", os.path.expanduser("~"))
+        directory = QFileDialog.getExistingDirectory(
+            self, "选择默认保存目录", os.path.expanduser("~"),
+            QFileDialog.Option.ShowDirsOnly | _FILE_DIALOG_OPTIONS,
+        )
         if directory:
             # persist to settings
             self.settings.setValue("default_save_path", directory)
@@ -545,8 +555,7 @@ class ElevenLabsWidget(QWidget):
             shown in a dialog.
         """
         if not api_key:
-             cfg = load_project_config().get('elevenlabs', {})
-             api_key = self.key_input.text().strip() or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
+            api_key = self.get_current_api_key()
 
         if not api_key:
             # no key -> nothing to contact, reset UI and quit early
@@ -557,17 +566,22 @@ class ElevenLabsWidget(QWidget):
         
         self.quota_worker = QuotaWorker(api_key)
         self.quota_worker.quota_info.connect(self.on_quota_loaded)
+        self._connect_quota_error(self.quota_worker.error, show_errors)
+        self.quota_worker.start()
+
+    def _connect_quota_error(self, signal, show_errors):
         if show_errors:
-            self.quota_worker.error.connect(self.on_error)
+            signal.connect(self.on_error)
         else:
-            self.quota_worker.error.connect(lambda msg: logger.warning(f"(silent) {msg}"))
-        self.quota_worker.start()
+            signal.connect(lambda msg: logger.warning(f"(silent) {msg}"))
 
     def on_voices_loaded(self, voices):
         self.voices_loaded = True
         self.combo_voices.blockSignals(True)
         self.combo_voices.clear()
         
+        # 先构建全部条目再一次性插入模型，避免逐条 addItem 反复触发行插入与布局更新
+        items = []
         for item in voices:
             # 兼容处理：解包 (name, vid, preview_url, category)
             if len(item) >= 4:
@@ -584,9 +598,12 @@ class ElevenLabsWidget(QWidget):
             if category == "premade":
                 display_name += " (Free)"
             
-            self.combo_voices.addItem(display_name, vid)
+            voice_item = QStandardItem(display_name)
+            voice_item.setData(vid, Qt.UserRole)
             if preview_url:
-                self.combo_voices.setItemData(self.combo_voices.count() - 1, preview_url, Qt.UserRole + 1)
+                voice_item.setData(preview_url, Qt.UserRole + 1)
+            items.append(voice_item)
+        self.combo_voices.model().invisibleRootItem().appendRows(items)
         
         # 添加“更多声音”选项
         self.combo_voices.insertSeparator(self.combo_voices.count())
@@ -779,7 +796,50 @@ class ElevenLabsWidget(QWidget):
             return
             
         self.lbl_status.setText("正在试听...")
-        self.player.setSource(QUrl(preview_url))
+        data = self._preview_cache.get(preview_url)
+        if data is not None:
+            self._preview_pending_url = None
+            self._preview_cache.move_to_end(preview_url)
+            self._play_preview_bytes(preview_url, data)
+            return
+
+        # 快速切换声音时只播放最后一次请求的样本
+        self._preview_pending_url = preview_url
+        self._preview_workers = {w for w in self._preview_workers if w.isRunning()}
+        worker = PreviewFetchWorker(preview_url)
+        worker.finished.connect(self.on_preview_fetched)
+        worker.error.connect(lambda msg, url=preview_url: self.on_preview_fetch_failed(url, msg))
+        self._preview_workers.add(worker)
+        worker.start()
+
+    def on_preview_fetched(self, preview_url, data):
+        self._preview_cache[preview_url] = data
+        self._preview_cache.move_to_end(preview_url)
+        while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        if preview_url == self._preview_pending_url:
+            self._preview_pending_url = None
+            self._play_preview_bytes(preview_url, data)
+
+    def on_preview_fetch_failed(self, preview_url, error_msg):
+        # 下载失败时退回由播放器直接拉取
+        logger.warning(f"试听样本下载失败，改为直接播放: {error_msg}")
+        if preview_url == self._preview_pending_url:
+            self._preview_pending_url = None
+            self.player.setSource(QUrl(preview_url))
+            self.player.play()
+            self.btn_play.setEnabled(True)
+
+    def _play_preview_bytes(self, preview_url, data):
+        buffer = QBuffer(self)
+        buffer.setData(QByteArray(data))
+        buffer.open(QBuffer.ReadOnly)
+        self.player.stop()
+        # URL 仅用于帮助后端识别格式
+        self.player.setSourceDevice(buffer, QUrl(preview_url))
+        if self._preview_buffer is not None:
+            self._preview_buffer.deleteLater()
+        self._preview_buffer = buffer
         self.player.play()
         self.btn_play.setEnabled(True)
 
@@ -794,7 +854,12 @@ class ElevenLabsWidget(QWidget):
         self.quota_bar.setValue(percent)
         self.quota_text_val.setText(f"{text} ({percent}%)")
         
-        if percent > 90:
+        danger = percent > 90
+        if danger == self._quota_danger:
+            return
+        self._quota_danger = danger
+
+        if danger:
             self.quota_bar.setStyleSheet("QProgressBar::chunk { background-color: #ef4444; border-radius: 5px; }")
         else:
             # 重置样式以使用默认的高亮色
@@ -808,7 +873,7 @@ class ElevenLabsWidget(QWidget):
         text = self.tts_text_input.toPlainText().strip()
         save_path = self.tts_save_input.text().strip()
         voice_id = self.combo_voices.itemData(self.combo_voices.currentIndex())
-        api_key = self.key_input.text().strip() or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
+        api_key = self.get_current_api_key()
         output_format = cfg.get('default_output_format')
         translate = self.chk_translate.isChecked()
         word_level = self.chk_word_level.isChecked()
@@ -852,7 +917,7 @@ class ElevenLabsWidget(QWidget):
             language_code=language_code,    # ⭐ 语言代码
             emotion=None                    # ⭐ 情绪现在嵌入在文本中，通过 [emotion] 标签指定
         )
-        self.tts_worker.finished.connect(self.on_generation_success)
+        self.tts_worker.finished.connect(lambda path: self.on_generation_success(path, "tts"))
         self.tts_worker.error.connect(self.on_error)
         self.tts_worker.start()
     
@@ -885,7 +950,8 @@ class ElevenLabsWidget(QWidget):
             self,
             xml_styles=self.xml_styles,
             video_settings=self.video_settings,
-            groq_settings=self.groq_settings
+            groq_settings=self.groq_settings,
+            preview_label=self.preview_label
         )
         
         if self.active_subtitle_dialog.exec() == QDialog.Accepted:
@@ -897,6 +963,9 @@ class ElevenLabsWidget(QWidget):
             self.video_settings = self.active_subtitle_dialog.get_video_settings()
             logger.info(f"视频设定已更新: {self.active_subtitle_dialog.get_video_settings()}")
         
+        # 对话框以本控件为父对象，只清空引用并不会销毁它；显式释放后，样式面板控件
+        # 连接到本控件的信号也随之断开，反复打开设置不会累积残留的面板和连接
+        self.active_subtitle_dialog.deleteLater()
         self.active_subtitle_dialog = None
 
     def generate_sfx_audio(self):
@@ -904,7 +973,7 @@ class ElevenLabsWidget(QWidget):
         prompt = self.sfx_prompt_input.toPlainText().strip()
         duration = self.sfx_duration_input.value()
         save_path = self.sfx_save_input.text().strip()
-        api_key = self.key_input.text().strip() or cfg.get('api_key') or os.getenv("ELEVENLABS_API_KEY", "")
+        api_key = self.get_current_api_key()
         output_format = cfg.get('default_output_format')
         
         if not prompt:
@@ -913,26 +982,28 @@ class ElevenLabsWidget(QWidget):
 
         self.set_ui_busy(True, "生成中...")
         self.sfx_worker = SFXWorker(api_key=api_key, prompt=prompt, duration=duration, save_path=save_path, output_format=output_format)
-        self.sfx_worker.finished.connect(self.on_generation_success)
+        self.sfx_worker.finished.connect(lambda path: self.on_generation_success(path, "sfx"))
         self.sfx_worker.error.connect(self.on_error)
         self.sfx_worker.start()
 
-    def on_generation_success(self, file_path):
+    def on_generation_success(self, file_path, kind):
         self.set_ui_busy(False, "生成成功")
         self.current_audio_path = file_path
         self.btn_play.setEnabled(True)
         self.slider_seek.setEnabled(True)
         
-        # 3. 解决同名文件缓存问题：先置空再加载
+        # 3. 解决同名文件缓存问题：只有与当前音源相同时才先置空再加载，避免重复初始化播放管线
         self.player.stop()
-        self.player.setSource(QUrl())
-        self.player.setSource(QUrl.fromLocalFile(file_path))
+        url = QUrl.fromLocalFile(file_path)
+        if self.player.source() == url:
+            self.player.setSource(QUrl())
+        self.player.setSource(url)
         
         self.lbl_status.setText("已保存")
         self.lbl_status.setToolTip(f"文件保存在: {file_path}")
         
-        # 自动刷新文件名以防覆盖
-        if "tts" in os.path.basename(file_path):
+        # 自动刷新文件名以防覆盖（按生成类型而非文件名判断，自定义文件名也能正确刷新）
+        if kind == "tts":
             self.tts_save_input.setText(self._generate_filename("tts"))
         else:
             self.sfx_save_input.setText(self._generate_filename("sfx"))
@@ -949,11 +1020,66 @@ class ElevenLabsWidget(QWidget):
             return
         QMessageBox.critical(self, "API 错误", str(error_msg))
 
+    def _build_sfx_panel(self):
+        """构建音效生成 (SFX) 功能区，仅在首次显示时调用"""
+        sfx_group = QWidget()
+        sfx_inner_layout = QVBoxLayout(sfx_group)
+        sfx_inner_layout.setContentsMargins(10, 15, 10, 10)
+        sfx_inner_layout.setSpacing(10)
+
+        # 提示词与时长
+        sfx_input_layout = QHBoxLayout()
+        self.sfx_prompt_input = QTextEdit()
+        self.sfx_prompt_input.setPlaceholderText("描述音效，例如: footsteps on wood floor...")
+        
+        sfx_ctrl_layout = QVBoxLayout()
+        self.sfx_duration_input = QSpinBox()
+        self.sfx_duration_input.setRange(1, 22) # ElevenLabs 通常限制较短
+        self.sfx_duration_input.setValue(5)
+        self.sfx_duration_input.setSuffix(" 秒")
+        sfx_ctrl_layout.addWidget(QLabel("时长:"))
+        sfx_ctrl_layout.addWidget(self.sfx_duration_input)
+        sfx_ctrl_layout.addStretch()
+
+        sfx_input_layout.addWidget(self.sfx_prompt_input, 1)
+        sfx_input_layout.addLayout(sfx_ctrl_layout)
+        sfx_inner_layout.addLayout(sfx_input_layout)
+
+        # 保存与生成
+        sfx_action_layout = QHBoxLayout()
+        self.sfx_save_input = QLineEdit(self._generate_filename("sfx"))
+        self.btn_sfx_browse = QPushButton("...")
+        self.btn_sfx_browse.setFixedWidth(40)
+        self.btn_sfx_browse.clicked.connect(lambda: self.browse_save_path(self.sfx_save_input, "Audio (*.mp3)"))
+        self.btn_sfx_default = QPushButton("默认路径")
+        self.btn_sfx_default.setFixedWidth(110)
+        self.btn_sfx_default.clicked.connect(lambda: self.choose_default_save_path(self.sfx_save_input))
+        
+        self.btn_sfx_generate = QPushButton("生成音效")
+        self.btn_sfx_generate.setObjectName("PrimaryButton")
+        self.btn_sfx_generate.clicked.connect(self.generate_sfx_audio)
+
+        sfx_action_layout.addWidget(QLabel("保存至:"))
+        sfx_action_layout.addWidget(self.sfx_save_input)
+        sfx_action_layout.addWidget(self.btn_sfx_browse)
+        sfx_action_layout.addWidget(self.btn_sfx_default)
+        sfx_action_layout.addWidget(self.btn_sfx_generate)
+        sfx_inner_layout.addLayout(sfx_action_layout)
+
+        default_dir = self.settings.value("default_save_path", "")
+        if default_dir:
+            try:
+                self.sfx_save_input.setText(os.path.join(default_dir, self._generate_filename("sfx")))
+            except Exception:
+                pass
+        return sfx_group
+
     def set_ui_busy(self, is_busy, status_text=""):
         # 禁用交互组件
         self.btn_load_voices.setEnabled(not is_busy)
         self.btn_tts_generate.setEnabled(not is_busy)
-        self.btn_sfx_generate.setEnabled(not is_busy)
+        if self._initialized:
+            self.btn_sfx_generate.setEnabled(not is_busy)
         self.combo_voices.setEnabled(not is_busy)
         self.tts_text_input.setEnabled(not is_busy)
         
@@ -972,27 +1098,37 @@ class ElevenLabsWidget(QWidget):
 
     def on_playback_state_changed(self, state):
         if state == QMediaPlayer.PlayingState:
-            self.update_timer.start()
             self.btn_play.setText("⏸ 暂停")
         elif state == QMediaPlayer.PausedState:
-            self.update_timer.stop()
             self.btn_play.setText("▶ 继续")
         else:
-            self.update_timer.stop()
             self.btn_play.setText("▶ 播放")
 
-    def update_ui_from_player(self):
-        if not self.is_seeking and self.player.playbackState() == QMediaPlayer.PlayingState:
+    def _on_position_changed(self, pos):
+        if self.is_seeking or self.player.playbackState() != QMediaPlayer.PlayingState:
+            return
+        # 只有滑块移动到新像素时才 setValue；时间标签只在秒数变化时更新
+        px = pos * self._slider_px_range // max(1, self.slider_seek.maximum())
+        if px != self._last_slider_px:
+            self._last_slider_px = px
             self.updating_slider = True
-            pos = self.player.position()
             self.slider_seek.setValue(pos)
-            self.lbl_current_time.setText(self._format_time(pos))
             self.updating_slider = False
+        sec = pos // 1000
+        if sec != self._last_time_sec:
+            self._last_time_sec = sec
+            self.lbl_current_time.setText(self._format_time(pos))
+
+    def _reset_player_ui_cache(self):
+        """滑块/标签被其他途径修改后，下次刷新必须重新绘制"""
+        self._last_slider_px = -1
+        self._last_time_sec = -1
 
     def on_media_status_changed(self, status):
         if status == QMediaPlayer.EndOfMedia:
             self.slider_seek.setValue(0)
             self.lbl_current_time.setText("00:00")
+            self._reset_player_ui_cache()
 
     def on_slider_pressed(self):
         self.is_seeking = True
@@ -1000,22 +1136,60 @@ class ElevenLabsWidget(QWidget):
     def on_slider_released(self):
         self.is_seeking = False
         self.player.setPosition(self.slider_seek.value())
+        self._reset_player_ui_cache()
 
     def on_slider_value_changed(self, value):
         if not self.updating_slider:
-            self.lbl_current_time.setText(self._format_time(value))
+            self._pending_drag_ms = value
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+
+    def _flush_drag_label(self):
+        if self._pending_drag_ms is not None:
+            self.lbl_current_time.setText(self._format_time(self._pending_drag_ms))
+            self._pending_drag_ms = None
 
     def on_duration_changed(self, duration):
         self.slider_seek.setRange(0, duration)
         self.lbl_total_time.setText(self._format_time(duration))
+        self._slider_px_range = max(1, self.slider_seek.width())
+        self._reset_player_ui_cache()
 
     def _format_time(self, ms):
-        seconds = (ms // 1000) % 60
-        minutes = (ms // 60000)
-        return f"{minutes:02d}:{seconds:02d}"
+        # 同一秒内重复调用直接返回上次的字符串
+        sec = ms // 1000
+        if sec == self._last_fmt_sec:
+            return self._last_fmt_str
+        self._last_fmt_sec = sec
+        self._last_fmt_str = f"{sec // 60:02d}:{sec % 60:02d}"
+        return self._last_fmt_str
 
     # ========== XML 样式设置相关方法 ==========
     
+    # 样式面板控件规格：(字段, 控件类型, 选项)，由 _make_style_control 统一创建、赋初值并连接信号
+    # 基础字体区按 (标签, 行, 列, 跨列数, 控件规格...) 排布在网格中，同一格的多个控件横向排列
+    _FONT_GRID_SPEC = (
+        ("字体:", 0, 0, 3, (('font', 'font', {'tooltip': "选择字体"}),)),
+        ("大小:", 1, 0, 1, (('fontSize', 'spin', {'range': (10, 200), 'suffix': " px", 'tooltip': "字体大小"}),)),
+        ("颜色:", 1, 2, 1, (('fontColor', 'color', {'tooltip': "字体颜色"}),)),
+        ("样式:", 2, 0, 3, (('bold', 'check', {'text': "加粗", 'tooltip': "加粗"}),
+                           ('italic', 'check', {'text': "斜体", 'tooltip': "斜体"}))),
+        ("对齐:", 3, 0, 1, (('alignment', 'combo', {'items': ('left', 'center', 'right')}),)),
+        ("Y轴位置:", 3, 2, 1, (('pos', 'spin', {'range': (-1000, 1000), 'tooltip': "Y轴位置 (向上为负，向下为正)"}),)),
+    )
+    # 效果区每行为 (开关控件, 受开关控制的控件...)
+    _EFFECT_ROW_SPEC = (
+        (('useStroke', 'check', {'text': "描边"}), (
+            ('strokeWidth', 'dspin', {'range': (0, 20), 'step': 0.5, 'suffix': " px"}),
+            ('strokeColor', 'color', {'tooltip': "描边颜色", 'width': 40}),
+        )),
+        (('useShadow', 'check', {'text': "阴影"}), (
+            ('shadowOffset', 'offset', {'axis': 0, 'range': (-50, 50), 'prefix': "X:", 'width': 60}),
+            ('shadowOffset', 'offset', {'axis': 1, 'range': (-50, 50), 'prefix': "Y:", 'width': 60}),
+            ('shadowColor', 'color', {'tooltip': "阴影颜色", 'width': 40}),
+        )),
+    )
+
     def create_style_settings_panel(self, style_type):
         """创建样式设置面板 (原文/翻译)"""
         widget = QWidget()
@@ -1027,183 +1201,120 @@ class ElevenLabsWidget(QWidget):
         font_group = QGroupBox("基础字体")
         font_layout = QGridLayout(font_group)
         font_layout.setSpacing(8)
-        
-        # 字体选择
-        font_combo = QFontComboBox()
-        font_combo.setCurrentFont(QFont(self.xml_styles[style_type]['font']))
-        font_combo.setToolTip("选择字体")
-        font_combo.currentFontChanged.connect(
-            lambda font: self.update_style(style_type, 'font', font.family())
-        )
-        font_layout.addWidget(QLabel("字体:"), 0, 0)
-        font_layout.addWidget(font_combo, 0, 1, 1, 3)
-        
-        # 大小 & 颜色
-        size_spin = QSpinBox()
-        size_spin.setRange(10, 200)
-        size_spin.setValue(self.xml_styles[style_type]['fontSize'])
-        size_spin.setSuffix(" px")
-        size_spin.setToolTip("字体大小")
-        size_spin.valueChanged.connect(
-            lambda val: self.update_style(style_type, 'fontSize', val)
-        )
-        font_layout.addWidget(QLabel("大小:"), 1, 0)
-        font_layout.addWidget(size_spin, 1, 1)
-        
-        font_color_btn = QPushButton()
-        font_color_btn.setToolTip("字体颜色")
-        self.set_button_color(font_color_btn, self.xml_styles[style_type]['fontColor'])
-        font_color_btn.clicked.connect(
-            lambda: self.pick_color(style_type, 'fontColor', font_color_btn)
-        )
-        font_layout.addWidget(QLabel("颜色:"), 1, 2)
-        font_layout.addWidget(font_color_btn, 1, 3)
-        
-        # 样式 (粗体/斜体)
-        style_layout = QHBoxLayout()
-        bold_chk = QCheckBox("加粗")
-        bold_chk.setToolTip("加粗")
-        bold_chk.setChecked(self.xml_styles[style_type]['bold'])
-        bold_chk.toggled.connect(
-            lambda checked: self.update_style(style_type, 'bold', checked)
-        )
-        italic_chk = QCheckBox("斜体")
-        italic_chk.setToolTip("斜体")
-        italic_chk.setChecked(self.xml_styles[style_type]['italic'])
-        italic_chk.toggled.connect(
-            lambda checked: self.update_style(style_type, 'italic', checked)
-        )
-        style_layout.addWidget(bold_chk)
-        style_layout.addWidget(italic_chk)
-        style_layout.addStretch()
-        font_layout.addWidget(QLabel("样式:"), 2, 0)
-        font_layout.addLayout(style_layout, 2, 1, 1, 3)
-        
-        # 对齐 & Y轴位置
-        align_combo = QComboBox()
-        align_combo.addItems(['left', 'center', 'right'])
-        align_combo.setCurrentText(self.xml_styles[style_type]['alignment'])
-        align_combo.currentTextChanged.connect(
-            lambda val: self.update_style(style_type, 'alignment', val)
-        )
-        font_layout.addWidget(QLabel("对齐:"), 3, 0)
-        font_layout.addWidget(align_combo, 3, 1)
-        
-        pos_spin = QSpinBox()
-        pos_spin.setRange(-1000, 1000)
-        pos_spin.setValue(self.xml_styles[style_type]['pos'])
-        pos_spin.setToolTip("Y轴位置 (向上为负，向下为正)")
-        pos_spin.valueChanged.connect(
-            lambda val: self.update_style(style_type, 'pos', val)
-        )
-        font_layout.addWidget(QLabel("Y轴位置:"), 3, 2)
-        font_layout.addWidget(pos_spin, 3, 3)
-        
+        for label, row, col, span, specs in self._FONT_GRID_SPEC:
+            font_layout.addWidget(QLabel(label), row, col)
+            controls = [self._make_style_control(style_type, *spec) for spec in specs]
+            if len(controls) == 1:
+                font_layout.addWidget(controls[0], row, col + 1, 1, span)
+            else:
+                cell_layout = QHBoxLayout()
+                for control in controls:
+                    cell_layout.addWidget(control)
+                cell_layout.addStretch()
+                font_layout.addLayout(cell_layout, row, col + 1, 1, span)
         main_layout.addWidget(font_group)
         
         # --- 2. 效果设置 (描边 + 阴影) ---
         effect_group = QGroupBox("效果设置 (描边 & 阴影)")
         effect_layout = QVBoxLayout(effect_group)
         effect_layout.setSpacing(10)
-        
-        # 描边行
-        stroke_layout = QHBoxLayout()
-        stroke_chk = QCheckBox("描边")
-        stroke_chk.setChecked(self.xml_styles[style_type].get('useStroke', False))
-        stroke_chk.toggled.connect(
-            lambda checked: self.update_style(style_type, 'useStroke', checked)
-        )
-        stroke_layout.addWidget(stroke_chk)
-        
-        stroke_width_spin = QDoubleSpinBox()
-        stroke_width_spin.setRange(0, 20)
-        stroke_width_spin.setValue(self.xml_styles[style_type]['strokeWidth'])
-        stroke_width_spin.setSingleStep(0.5)
-        stroke_width_spin.setSuffix(" px")
-        stroke_width_spin.valueChanged.connect(
-            lambda val: self.update_style(style_type, 'strokeWidth', val)
-        )
-        stroke_chk.toggled.connect(stroke_width_spin.setEnabled)
-        stroke_width_spin.setEnabled(stroke_chk.isChecked())
-        stroke_layout.addWidget(stroke_width_spin)
-        
-        stroke_color_btn = QPushButton()
-        stroke_color_btn.setToolTip("描边颜色")
-        stroke_color_btn.setFixedWidth(40)
-        self.set_button_color(stroke_color_btn, self.xml_styles[style_type]['strokeColor'])
-        stroke_color_btn.clicked.connect(
-            lambda: self.pick_color(style_type, 'strokeColor', stroke_color_btn)
-        )
-        stroke_chk.toggled.connect(stroke_color_btn.setEnabled)
-        stroke_color_btn.setEnabled(stroke_chk.isChecked())
-        stroke_layout.addWidget(stroke_color_btn)
-        stroke_layout.addStretch()
-        
-        # 阴影行
-        shadow_layout = QHBoxLayout()
-        shadow_chk = QCheckBox("阴影")
-        shadow_chk.setChecked(self.xml_styles[style_type].get('useShadow', False))
-        shadow_chk.toggled.connect(
-            lambda checked: self.update_style(style_type, 'useShadow', checked)
-        )
-        shadow_layout.addWidget(shadow_chk)
-        
-        shadow_x = QSpinBox()
-        shadow_x.setRange(-50, 50)
-        shadow_x.setValue(self.xml_styles[style_type]['shadowOffset'][0])
-        shadow_x.setPrefix("X:")
-        shadow_x.setFixedWidth(60)
-        shadow_x.valueChanged.connect(
-            lambda val: self.update_shadow_offset(style_type, val, None)
-        )
-        shadow_chk.toggled.connect(shadow_x.setEnabled)
-        shadow_x.setEnabled(shadow_chk.isChecked())
-        shadow_layout.addWidget(shadow_x)
-        
-        shadow_y = QSpinBox()
-        shadow_y.setRange(-50, 50)
-        shadow_y.setValue(self.xml_styles[style_type]['shadowOffset'][1])
-        shadow_y.setPrefix("Y:")
-        shadow_y.setFixedWidth(60)
-        shadow_y.valueChanged.connect(
-            lambda val: self.update_shadow_offset(style_type, None, val)
-        )
-        shadow_chk.toggled.connect(shadow_y.setEnabled)
-        shadow_y.setEnabled(shadow_chk.isChecked())
-        shadow_layout.addWidget(shadow_y)
-        
-        shadow_color_btn = QPushButton()
-        shadow_color_btn.setToolTip("阴影颜色")
-        shadow_color_btn.setFixedWidth(40)
-        self.set_button_color(shadow_color_btn, self.xml_styles[style_type]['shadowColor'])
-        shadow_color_btn.clicked.connect(
-            lambda: self.pick_color(style_type, 'shadowColor', shadow_color_btn)
-        )
-        shadow_chk.toggled.connect(shadow_color_btn.setEnabled)
-        shadow_color_btn.setEnabled(shadow_chk.isChecked())
-        shadow_layout.addWidget(shadow_color_btn)
-        shadow_layout.addStretch()
-        
-        effect_layout.addLayout(stroke_layout)
-        effect_layout.addLayout(shadow_layout)
+        for toggle_spec, dependent_specs in self._EFFECT_ROW_SPEC:
+            row_layout = QHBoxLayout()
+            toggle = self._make_style_control(style_type, *toggle_spec)
+            row_layout.addWidget(toggle)
+            # 受控控件放进同一容器，开关只需启用/禁用容器，由 Qt 递归作用到子控件
+            controls = QWidget()
+            controls_layout = QHBoxLayout(controls)
+            controls_layout.setContentsMargins(0, 0, 0, 0)
+            for spec in dependent_specs:
+                controls_layout.addWidget(self._make_style_control(style_type, *spec))
+            toggle.toggled.connect(controls.setEnabled)
+            controls.setEnabled(toggle.isChecked())
+            row_layout.addWidget(controls)
+            row_layout.addStretch()
+            effect_layout.addLayout(row_layout)
         main_layout.addWidget(effect_group)
         
         main_layout.addStretch()
         return widget
-        
-        main_layout.addStretch()
-        
-        return widget
+
+    def _make_style_control(self, style_type, key, kind, opts):
+        """按规格创建单个样式控件，赋初值后再连接信号"""
+        style = self.xml_styles[style_type]
+        if kind == 'font':
+            control = QFontComboBox()
+            control.setCurrentFont(QFont(style[key]))
+            signal, slot = control.currentFontChanged, self._on_style_font_changed
+        elif kind == 'check':
+            control = QCheckBox(opts['text'])
+            control.setChecked(style.get(key, False))
+            signal, slot = control.toggled, self._on_style_value_changed
+        elif kind == 'combo':
+            control = QComboBox()
+            control.addItems(opts['items'])
+            control.setCurrentText(style[key])
+            signal, slot = control.currentTextChanged, self._on_style_value_changed
+        elif kind == 'color':
+            control = QPushButton()
+            self.set_button_color(control, style[key])
+            signal, slot = control.clicked, self._on_style_color_clicked
+        else:
+            # spin / dspin / offset（阴影偏移的单个分量）
+            control = QDoubleSpinBox() if kind == 'dspin' else QSpinBox()
+            control.setRange(*opts['range'])
+            if kind == 'offset':
+                control.setValue(style[key][opts['axis']])
+                control.setProperty("shadow_axis", opts['axis'])
+                slot = self._on_shadow_offset_changed
+            else:
+                control.setValue(style[key])
+                slot = self._on_style_value_changed
+            if 'step' in opts:
+                control.setSingleStep(opts['step'])
+            if 'suffix' in opts:
+                control.setSuffix(opts['suffix'])
+            if 'prefix' in opts:
+                control.setPrefix(opts['prefix'])
+            signal = control.valueChanged
+        if 'tooltip' in opts:
+            control.setToolTip(opts['tooltip'])
+        if 'width' in opts:
+            control.setFixedWidth(opts['width'])
+        self._tag_style_widget(control, style_type, key)
+        signal.connect(slot)
+        return control
     
+    # 样式面板控件通过动态属性记录所属样式与字段，信号统一连接到以下绑定方法，不再为每个控件创建闭包
+    def _tag_style_widget(self, widget, style_type, key):
+        widget.setProperty("style_type", style_type)
+        widget.setProperty("style_key", key)
+
+    def _on_style_value_changed(self, value):
+        sender = self.sender()
+        self.update_style(sender.property("style_type"), sender.property("style_key"), value)
+
+    def _on_style_font_changed(self, font):
+        self.update_style(self.sender().property("style_type"), 'font', font.family())
+
+    def _on_style_color_clicked(self):
+        button = self.sender()
+        self.pick_color(button.property("style_type"), button.property("style_key"), button)
+
+    def _on_shadow_offset_changed(self, value):
+        sender = self.sender()
+        if sender.property("shadow_axis") == 0:
+            self.update_shadow_offset(sender.property("style_type"), value, None)
+        else:
+            self.update_shadow_offset(sender.property("style_type"), None, value)
+
     def set_button_color(self, button, color_tuple):
         """设置按钮的背景颜色以反映 RGBA 颜色"""
         if isinstance(color_tuple, (list, tuple)) and len(color_tuple) >= 4:
-            r, g, b, a = int(color_tuple[0]*255), int(color_tuple[1]*255), int(color_tuple[2]*255), int(color_tuple[3]*255)
+            rgb = tuple(color_tuple[:3])
         else:
-            r, g, b, a = 255, 255, 255, 255
+            rgb = (1.0, 1.0, 1.0)
         
-        qcolor = QColor(r, g, b, a)
-        button.setStyleSheet(f"background-color: {qcolor.name()}; border-radius: 4px;")
+        button.setStyleSheet(_color_button_css(rgb))
         button.setFixedHeight(32)
     
     def pick_color(self, style_type, key, button):
@@ -1215,7 +1326,14 @@ class ElevenLabsWidget(QWidget):
         else:
             initial_color = QColor(255, 255, 255, 255)
         
-        color = QColorDialog.getColor(initial_color, self, f"选择{key}颜色")
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+        dialog = self._color_dialog
+        dialog.setWindowTitle(f"选择{key}颜色")
+        dialog.setCurrentColor(initial_color)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        color = dialog.selectedColor()
         if color.isValid():
             r, g, b, a = color.getRgb()
             color_tuple = (r/255.0, g/255.0, b/255.0, a/255.0)
@@ -1225,16 +1343,25 @@ class ElevenLabsWidget(QWidget):
     def update_style(self, style_type, key, value):
         """更新样式设置并刷新预览"""
         self.xml_styles[style_type][key] = value
-        self.update_preview()
+        self._schedule_preview()
     
     def update_shadow_offset(self, style_type, x=None, y=None):
         """更新阴影偏移"""
-        current = list(self.xml_styles[style_type]['shadowOffset'])
+        offset = self.xml_styles[style_type]['shadowOffset']
         if x is not None:
-            current[0] = x
+            offset[0] = x
         if y is not None:
-            current[1] = y
-        self.xml_styles[style_type]['shadowOffset'] = tuple(current)
+            offset[1] = y
+        self._schedule_preview()
+
+    def _schedule_preview(self):
+        """合并连续的样式修改（如按住微调框），在下一轮事件循环中只刷新一次预览"""
+        if not self._preview_dirty:
+            self._preview_dirty = True
+            QTimer.singleShot(0, self._flush_preview)
+
+    def _flush_preview(self):
+        self._preview_dirty = False
         self.update_preview()
     
     def on_video_settings_changed(self):
@@ -1244,29 +1371,26 @@ class ElevenLabsWidget(QWidget):
         except:
             self.video_settings['fps'] = 30
 
+    # 分辨率预设，顺序与预设下拉框一致：1080p / 2K / 4K
+    _RES_PRESETS = ((1920, 1080), (2560, 1440), (3840, 2160))
+
     def on_resolution_preset_changed(self, index):
-        preset = self.combo_res.currentText()
-        is_vertical = self.chk_vertical.isChecked()
-        
-        w, h = 1920, 1080 # Default
-        
-        if "1080p" in preset:
-            w, h = 1920, 1080
-        elif "2K" in preset:
-            w, h = 2560, 1440
-        elif "4K" in preset:
-            w, h = 3840, 2160
+        # 直接按下拉框索引取值，越界时回退到 1080p
+        self._base_wh = self._RES_PRESETS[index] if 0 <= index < len(self._RES_PRESETS) else self._RES_PRESETS[0]
+        self._apply_resolution(self.chk_vertical.isChecked())
+
+    def on_vertical_toggled(self, checked):
+        # 预设未变，只按方向交换已记录的宽高
+        self._apply_resolution(checked)
 
+    def _apply_resolution(self, is_vertical):
+        w, h = self._base_wh
         if is_vertical:
             w, h = h, w
             
         self.video_settings['width'] = w
         self.video_settings['height'] = h
 
-    def on_vertical_toggled(self, checked):
-        # 重新触发一次分辨率选择逻辑以应用翻转
-        self.on_resolution_preset_changed(self.combo_res.currentIndex())
-
     def update_preview(self):  
         """更新预览窗口 - 支持对话框和主窗口"""
         # 如果对话框打开，更新对话框内的预览
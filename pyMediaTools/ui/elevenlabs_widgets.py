@@ -1,10 +1,11 @@
 import re
+from functools import lru_cache
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QTextEdit, QScrollArea, QFrame,
                                QSizePolicy, QMessageBox)
-from PySide6.QtCore import Qt, QMimeData, QSettings, QRectF
+from PySide6.QtCore import Qt, QMimeData, QSettings, QRectF, QPointF
 from PySide6.QtGui import (QDrag, QSyntaxHighlighter, QTextCharFormat, QColor, 
-                           QPainter, QPainterPath, QPen, QBrush, QFontMetrics, QFont)
+                           QPainter, QPainterPath, QPen, QBrush, QFontMetrics, QFont, QPixmap)
 
 from ..logging_config import get_logger
 from ..core.groq_analysis import EmotionAnalysisWorker
@@ -294,11 +295,57 @@ class EmotionTagManager(QWidget):
         return {emotion: text.count(f'[{emotion}]') for emotion in matches}
 
 
+@lru_cache(maxsize=32)
+def _font_from_key(font_key):
+    """按 (family, size, bold, italic) 缓存 QFont，调用方不得修改返回的对象"""
+    family, size, bold, italic = font_key
+    font = QFont(family, size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+@lru_cache(maxsize=32)
+def _font_metrics(font_key):
+    return QFontMetrics(_font_from_key(font_key))
+
+
+@lru_cache(maxsize=512)
+def _line_advance(font_key, line):
+    """单行文字的排版宽度，调整控件尺寸重算排版时不必重新测量"""
+    return _font_metrics(font_key).horizontalAdvance(line)
+
+
+@lru_cache(maxsize=256)
+def _line_path(font_key, line):
+    """
+    单行文字在原点处的轮廓，按 (字体, 文本) 跨实例缓存。
+    以整行为单位而非逐字缓存，保留连字、字距和复杂文字（如天城文）的整形结果。
+    """
+    path = QPainterPath()
+    path.addText(0, 0, _font_from_key(font_key), line)
+    return path
+
+
 class SubtitlePreviewLabel(QLabel):
     """自定义预览标签，支持描边、阴影和背景绘制"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.style_data = {}
+        # 文字轮廓与背景矩形缓存：文本、字体、间距和控件尺寸都未变化时直接复用
+        # _path_key 只覆盖文字轮廓，_cache_key 另含背景参数：调整背景时不必重建文字轮廓
+        self._path_key = None
+        self._cache_key = None
+        self._font_cache = None
+        self._path_cache = None
+        self._path_extent = None
+        self._bg_rect = None
+        self._content_rect = QRectF()
+        # 分图层渲染缓存（背景/阴影/描边/文字）：每层只随自身相关的样式项失效，尺寸/文本变化体现在 _cache_key 中
+        self._layer_keys = {}
+        self._layer_pixmaps = {}
+        # 各图层叠加后的整幅图像：样式或排版未变时重绘只需贴这一张图
+        self._composite = None
         self.setText("预览文本\nPreview Text")
         self.setAlignment(Qt.AlignCenter)
         self.setMinimumHeight(80)
@@ -306,85 +353,164 @@ class SubtitlePreviewLabel(QLabel):
 
     def update_style(self, style_data):
         self.style_data = style_data
+        # 颜色在样式变化时转换一次，paintEvent 中直接使用
+        s = style_data
+        font_color = tuple(s.get('fontColor', (1, 1, 1, 1)))
+        bg_color = tuple(s.get('backgroundColor', (0, 0, 0, 0)))
+        shadow_color = tuple(s.get('shadowColor', (0, 0, 0, 0.5)))
+        shadow_offset = tuple(s.get('shadowOffset', (2, 2)))
+        stroke_color = tuple(s.get('strokeColor', (0, 0, 0, 1)))
+        stroke_width = s.get('strokeWidth', 0)
+        # 绘制路径上用到的开关与排版参数也在此处一次性取出，paintEvent 不再逐项查询样式字典
+        self._font_key = (s.get('font', 'Arial'), s.get('fontSize', 50), s.get('bold', False), s.get('italic', False))
+        self._line_spacing = s.get('lineSpacing', 0)
+        self._bg_params = (s.get('useBackground', False), s.get('backgroundPadding', 0))
+        self._use_shadow = s.get('useShadow', False)
+        self._use_stroke = s.get('useStroke', False) and stroke_width > 0
+        self._stroke_extent = stroke_width if s.get('useStroke', False) else 0
+        self._font_brush = QBrush(QColor.fromRgbF(*font_color))
+        self._bg_brush = QBrush(QColor.fromRgbF(*bg_color))
+        self._shadow_brush = QBrush(QColor.fromRgbF(*shadow_color))
+        self._shadow_offset = QPointF(*shadow_offset)
+        self._stroke_pen = QPen(QColor.fromRgbF(*stroke_color), stroke_width)
+        # 各图层只记录影响自身的样式项；字体、字号、文本等排版参数由 _cache_key 统一覆盖
+        self._layer_keys = {
+            'bg': bg_color,
+            'shadow': (self._use_shadow, shadow_color, shadow_offset),
+            'stroke': (self._use_stroke, stroke_color, stroke_width),
+            'fill': font_color,
+        }
+        self._composite = None
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-
-        s = self.style_data
-        if not s:
-            super().paintEvent(event)
-            return
+    def _text_geometry(self):
+        """返回 (font, 文字轮廓, 背景矩形)，文字轮廓仅在影响排版的参数变化时重新生成"""
+        path_key = (self.text(), self._font_key, self._line_spacing, self.width(), self.height())
+        key = (path_key, self._bg_params)
+        if key == self._cache_key:
+            return self._font_cache, self._path_cache, self._bg_rect
 
-        font = QFont(s.get('font', 'Arial'), s.get('fontSize', 50))
-        font.setBold(s.get('bold', False))
-        font.setItalic(s.get('italic', False))
-        painter.setFont(font)
+        if path_key != self._path_key:
+            font_key = self._font_key
+            spacing = self._line_spacing
+            font = _font_from_key(font_key)
 
-        fc = s.get('fontColor', (1, 1, 1, 1))
-        font_color = QColor.fromRgbF(*fc)
-        
-        if s.get('useBackground', False):
-            bc = s.get('backgroundColor', (0, 0, 0, 0))
-            bg_color = QColor.fromRgbF(*bc)
-            padding = s.get('backgroundPadding', 0)
-            
-            metrics = QFontMetrics(font)
+            # 每行只测量一次，背景尺寸与文字定位共用同一组结果
+            metrics = _font_metrics(font_key)
             line_height = metrics.height()
             lines = self.text().split('\n')
-            max_width = 0
-            total_height = len(lines) * line_height + (len(lines) - 1) * s.get('lineSpacing', 0)
-            
-            for line in lines:
-                max_width = max(max_width, metrics.horizontalAdvance(line))
-            
+            advances = [_line_advance(font_key, line) for line in lines]
+            content_height = len(lines) * line_height + (len(lines) - 1) * spacing
+
+            path = QPainterPath()
+            y = (self.height() - content_height) / 2 + metrics.ascent()
+            for line, text_width in zip(lines, advances):
+                x = (self.width() - text_width) / 2
+                path.addPath(_line_path(font_key, line).translated(x, y))
+                y += line_height + spacing
+
+            self._path_key = path_key
+            self._font_cache, self._path_cache = font, path
+            self._path_extent = (max(advances), content_height)
+
+        bg_rect = None
+        use_background, padding = self._bg_params
+        if use_background:
+            max_width, content_height = self._path_extent
             cx, cy = self.width() / 2, self.height() / 2
-            bg_rect = QRectF(cx - max_width/2 - padding, cy - total_height/2 - padding, 
-                             max_width + padding*2, total_height + padding*2)
-            
-            painter.setBrush(QBrush(bg_color))
+            bg_rect = QRectF(cx - max_width/2 - padding, cy - content_height/2 - padding, 
+                             max_width + padding*2, content_height + padding*2)
+
+        path = self._path_cache
+        self._cache_key = key
+        self._bg_rect = bg_rect
+        self._content_rect = path.boundingRect() if bg_rect is None else path.boundingRect().united(bg_rect)
+        return self._font_cache, path, bg_rect
+
+    def _painted_rect(self):
+        """文字、背景连同阴影偏移和描边宽度实际覆盖的区域"""
+        rect = self._content_rect
+        if self._use_shadow:
+            rect = rect.united(rect.translated(self._shadow_offset))
+        if self._stroke_extent:
+            w = self._stroke_extent
+            rect = rect.adjusted(-w, -w, w, w)
+        # 抗锯齿边缘可能越过几何边界一个像素
+        return rect.adjusted(-1, -1, 1, 1)
+
+    def _render_layer(self, painter, layer, path, bg_rect):
+        """绘制单个图层（背景/阴影/描边/文字），该图层未启用时返回 False"""
+        if layer == 'bg':
+            if bg_rect is None:
+                return False
+            painter.setBrush(self._bg_brush)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(bg_rect, 8, 8)
-
-        path = QPainterPath()
-        metrics = QFontMetrics(font)
-        line_height = metrics.height()
-        lines = self.text().split('\n')
-        spacing = s.get('lineSpacing', 0)
-        content_height = len(lines) * line_height + (len(lines) - 1) * spacing
-        y = (self.height() - content_height) / 2 + metrics.ascent()
-        
-        for line in lines:
-            text_width = metrics.horizontalAdvance(line)
-            x = (self.width() - text_width) / 2
-            path.addText(x, y, font, line)
-            y += line_height + spacing
-
-        if s.get('useShadow', False):
-            sc = s.get('shadowColor', (0, 0, 0, 0.5))
-            shadow_color = QColor.fromRgbF(*sc)
-            offset = s.get('shadowOffset', (2, 2))
-            
-            painter.save()
-            painter.translate(offset[0], offset[1])
+        elif layer == 'shadow':
+            if not self._use_shadow:
+                return False
+            painter.translate(self._shadow_offset)
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(shadow_color))
+            painter.setBrush(self._shadow_brush)
+            painter.drawPath(path)
+        elif layer == 'stroke':
+            if not self._use_stroke:
+                return False
+            painter.setPen(self._stroke_pen)
+            painter.setBrush(Qt.NoBrush)
             painter.drawPath(path)
-            painter.restore()
+        else:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._font_brush)
+            painter.drawPath(path)
+        return True
+
+    def _layer_pixmap(self, layer, path, bg_rect, dpr):
+        """返回图层的缓存图像，只有排版或该图层相关样式变化时才重新光栅化"""
+        # 背景层随背景参数变化，文字相关图层只依赖文字轮廓
+        geometry_key = self._cache_key if layer == 'bg' else self._path_key
+        key = (geometry_key, dpr, self._layer_keys[layer])
+        cached = self._layer_pixmaps.get(layer)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        pm_painter = QPainter(pixmap)
+        # 文字以路径填充绘制，不经过 drawText，只需几何抗锯齿
+        pm_painter.setRenderHint(QPainter.Antialiasing)
+        drawn = self._render_layer(pm_painter, layer, path, bg_rect)
+        pm_painter.end()
+        if not drawn:
+            pixmap = None
+        self._layer_pixmaps[layer] = (key, pixmap)
+        return pixmap
 
-        if s.get('useStroke', False):
-            stc = s.get('strokeColor', (0, 0, 0, 1))
-            stroke_color = QColor.fromRgbF(*stc)
-            stroke_width = s.get('strokeWidth', 0)
-            
-            if stroke_width > 0:
-                pen = QPen(stroke_color, stroke_width)
-                painter.setPen(pen)
-                painter.setBrush(Qt.NoBrush)
-                painter.drawPath(path)
-
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(font_color))
-        painter.drawPath(path)
+    def paintEvent(self, event):
+        if not self.style_data:
+            super().paintEvent(event)
+            return
+
+        font, path, bg_rect = self._text_geometry()
+        # 本次重绘区域与绘制内容不相交时（如只露出空白边缘）直接跳过
+        if not self._painted_rect().intersects(QRectF(event.rect())):
+            return
+
+        dpr = self.devicePixelRatioF()
+        composite_key = (self._cache_key, dpr)
+        if self._composite is None or self._composite[0] != composite_key:
+            # 按背景、阴影、描边、文字的顺序叠加各图层，调整单项样式时其余图层直接复用
+            composite = QPixmap(self.size() * dpr)
+            composite.setDevicePixelRatio(dpr)
+            composite.fill(Qt.transparent)
+            cp_painter = QPainter(composite)
+            for layer in ('bg', 'shadow', 'stroke', 'fill'):
+                pixmap = self._layer_pixmap(layer, path, bg_rect, dpr)
+                if pixmap is not None:
+                    cp_painter.drawPixmap(0, 0, pixmap)
+            cp_painter.end()
+            self._composite = (composite_key, composite)
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._composite[1])
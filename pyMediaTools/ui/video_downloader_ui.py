@@ -1,9 +1,10 @@
 import os
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                                QComboBox, QMessageBox, QProgressBar, QFileDialog, 
-                               QGroupBox, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QSpinBox,
-                               QDialog, QTextEdit, QMenu, QApplication, QFormLayout)
-from PySide6.QtCore import Qt, QPoint, Signal, QSettings
+                               QGroupBox, QTableView, QHeaderView, QCheckBox, QSpinBox,
+                               QDialog, QTextEdit, QMenu, QApplication, QFormLayout,
+                               QStyledItemDelegate, QStyle, QStyleOptionProgressBar, QAbstractItemView)
+from PySide6.QtCore import Qt, QPoint, Signal, QSettings, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QAction, QFont
 
 from ..core.videodownloader import YtDlpInfoWorker, YtDlpDownloadWorker
@@ -11,6 +12,150 @@ from ..core.ytdlp_updater import YtDlpVersionManager
 from ..core.ytdlp_update_worker import YtDlpCheckUpdateWorker, YtDlpUpdateWorker
 from .styles import apply_common_style
 
+# 目录选择框改用 Qt 自带对话框（不枚举网络共享、不读取文件夹自定义图标），慢速磁盘/网络共享上打开更快；
+# DontUseCustomDirectoryIcons 只对 Qt 自带对话框生效，须与 DontUseNativeDialog 一起使用
+_DIR_DIALOG_OPTIONS = (QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseNativeDialog
+                       | QFileDialog.Option.DontUseCustomDirectoryIcons)
+
+class VideoTaskTableModel(QAbstractTableModel):
+    """
+    下载任务列表模型：数据保存在 Python 列表中，进度更新只对变化的单元格发出 dataChanged，
+    不再为每次进度刷新创建/替换单元格对象
+    """
+    HEADERS = ["", "标题", "时长", "状态/进度"]
+    COL_CHECK, COL_TITLE, COL_DURATION, COL_STATUS = range(4)
+    # 状态列的进度值（0-100 的整数），为 None 时只显示文字
+    ProgressRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._checked = []
+        self._durations = []
+        self._status = []
+
+    def set_entries(self, entries):
+        """替换全部任务（解析完成/清空列表时调用）"""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._checked = [True] * len(self._entries)
+        self._durations = [self._format_duration(e.get('duration')) for e in self._entries]
+        self._status = [("待下载", None)] * len(self._entries)
+        self.endResetModel()
+
+    @staticmethod
+    def _format_duration(dur):
+        return f"{int(dur//60)}:{int(dur%60):02d}" if dur else "--:--"
+
+    def entry(self, row):
+        return self._entries[row]
+
+    def is_checked(self, row):
+        return self._checked[row]
+
+    def set_all_checked(self, checked):
+        """一次性修改整列勾选状态，只发出一次 dataChanged"""
+        if not self._entries:
+            return
+        self._checked = [checked] * len(self._entries)
+        self.dataChanged.emit(
+            self.index(0, self.COL_CHECK),
+            self.index(len(self._entries) - 1, self.COL_CHECK),
+            [Qt.CheckStateRole],
+        )
+
+    def set_status(self, row, text, progress=None):
+        """更新某行的状态文字与进度；内容未变化时不触发重绘"""
+        if not 0 <= row < len(self._status):
+            return
+        value = (text, progress)
+        if self._status[row] == value:
+            return
+        self._status[row] = value
+        index = self.index(row, self.COL_STATUS)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, self.ProgressRole])
+
+    def set_status_many(self, rows, text):
+        """批量设置多行状态，只对覆盖这些行的区间发出一次 dataChanged"""
+        rows = [row for row in rows if 0 <= row < len(self._status)]
+        if not rows:
+            return
+        for row in rows:
+            self._status[row] = (text, None)
+        self.dataChanged.emit(
+            self.index(min(rows), self.COL_STATUS),
+            self.index(max(rows), self.COL_STATUS),
+            [Qt.DisplayRole, self.ProgressRole],
+        )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == self.COL_CHECK:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._checked[row] else Qt.Unchecked
+        elif role == Qt.DisplayRole:
+            if col == self.COL_TITLE:
+                return self._entries[row].get('title', 'Unknown')
+            if col == self.COL_DURATION:
+                return self._durations[row]
+            if col == self.COL_STATUS:
+                return self._status[row][0]
+        elif role == self.ProgressRole and col == self.COL_STATUS:
+            return self._status[row][1]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if index.isValid() and index.column() == self.COL_CHECK and role == Qt.CheckStateRole:
+            self._checked[index.row()] = Qt.CheckState(value) == Qt.Checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.COL_CHECK:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """
+    在状态列直接绘制进度条（QStyle::CE_ProgressBar），替代逐行嵌入的 QProgressBar 控件
+    """
+    def paint(self, painter, option, index):
+        progress = index.data(VideoTaskTableModel.ProgressRole)
+        if progress is None:
+            super().paint(painter, option, index)
+            return
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 3, -2, -3)
+        # Qt 6 的 QStyleOptionProgressBar 没有方向字段，样式从 State_Horizontal 判断方向
+        bar.state = option.state | QStyle.State_Horizontal
+        bar.direction = option.direction
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = progress
+        bar.text = index.data(Qt.DisplayRole) or ""
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignCenter
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, option.widget)
+
+
 class VideoDownloadWidget(QWidget):
     def __init__(self):
         super().__init__()
@@ -28,6 +173,8 @@ class VideoDownloadWidget(QWidget):
         self.local_version = self.version_manager.get_local_version()
         self.remote_version = None
         self.update_dialog = None  # 引用更新对话框实例
+        # 页面隐藏期间只记录最新一次进度，重新显示时再刷新总进度条与状态文字
+        self._pending_progress = None
         
         self.initUI()
         self.apply_styles()
@@ -71,14 +218,17 @@ class VideoDownloadWidget(QWidget):
         parse_list_layout.addLayout(tool_layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["", "标题", "时长", "状态/进度"])
+        self.task_model = VideoTaskTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.task_model)
+        self.table.setItemDelegateForColumn(VideoTaskTableModel.COL_STATUS, ProgressBarDelegate(self.table))
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        # 固定宽度，避免每次进度刷新都按内容重新计算列宽
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Fixed)
         self.table.setColumnWidth(0, 40)
+        self.table.setColumnWidth(3, 120)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
         parse_list_layout.addWidget(self.table)
@@ -199,9 +349,7 @@ class VideoDownloadWidget(QWidget):
         layout.addWidget(opts_prog_group)
 
     def toggle_select_all(self, checked):
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        self.task_model.set_all_checked(checked)
 
     def update_format_options(self):
         is_audio = self.chk_audio_only.isChecked()
@@ -220,13 +368,13 @@ class VideoDownloadWidget(QWidget):
             self.chk_subs.setEnabled(True)
 
     def browse_output(self):
-        d = QFileDialog.getExistingDirectory(self, "选择保存目录")
+        d = QFileDialog.getExistingDirectory(self, "选择保存目录", options=_DIR_DIALOG_OPTIONS)
         if d:
             self.out_path.setText(d)
 
     def configure_default_path(self):
         current_path = self.out_path.text()
-        d = QFileDialog.getExistingDirectory(self, "选择默认保存目录", current_path)
+        d = QFileDialog.getExistingDirectory(self, "选择默认保存目录", current_path, _DIR_DIALOG_OPTIONS)
         if d:
             self.settings.setValue("default_path", d)
             self.out_path.setText(d)
@@ -238,7 +386,7 @@ class VideoDownloadWidget(QWidget):
         
         self.btn_analyze.setEnabled(False)
         self.status_label.setText("正在解析链接信息...")
-        self.table.setRowCount(0)
+        self.task_model.set_entries([])
         self.video_list_data = []
         self.chk_select_all.setChecked(True)
         
@@ -253,26 +401,12 @@ class VideoDownloadWidget(QWidget):
         
         entries = list(info['entries']) if 'entries' in info else [info]
         self.video_list_data = entries
-        self.table.setRowCount(len(entries))
-        
-        for i, entry in enumerate(entries):
-            # Checkbox
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            chk_item.setCheckState(Qt.Checked)
-            self.table.setItem(i, 0, chk_item)
-            
-            # Title
-            title = entry.get('title', 'Unknown')
-            self.table.setItem(i, 1, QTableWidgetItem(title))
-            
-            # Duration
-            dur = entry.get('duration')
-            dur_str = f"{int(dur//60)}:{int(dur%60):02d}" if dur else "--:--"
-            self.table.setItem(i, 2, QTableWidgetItem(dur_str))
-            
-            # Status (New Column)
-            self.table.setItem(i, 3, QTableWidgetItem("待下载"))
+        # 大播放列表一次性填充：填充期间暂停重绘，完成后统一刷新
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.task_model.set_entries(entries)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def on_info_error(self, err):
         self.btn_analyze.setEnabled(True)
@@ -288,12 +422,12 @@ class VideoDownloadWidget(QWidget):
         global_pos = self.table.mapToGlobal(pos)
         # itemAt expects coordinates relative to viewport
         viewport_pos = self.table.viewport().mapFromGlobal(global_pos)
-        item = self.table.itemAt(viewport_pos)
+        index = self.table.indexAt(viewport_pos)
         
-        if not item:
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         if row < 0 or row >= len(self.video_list_data):
             return
             
@@ -329,8 +463,8 @@ class VideoDownloadWidget(QWidget):
         # Build list of dicts: {'url': url, 'ui_index': i, 'title': title}
         items_to_download = []
         
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).checkState() == Qt.Checked:
+        for i in range(self.task_model.rowCount()):
+            if self.task_model.is_checked(i):
                 entry = self.video_list_data[i]
                 url = entry.get('webpage_url') or entry.get('url')
                 title = entry.get('title', 'Unknown')
@@ -400,9 +534,8 @@ class VideoDownloadWidget(QWidget):
         self.btn_download.setText("⏹ 停止下载")
         self.btn_download.setStyleSheet("background-color: #8B0000; color: white; font-weight: bold;")
         
-        # Reset table status for selected
-        for item in items_to_download:
-            self.table.item(item['ui_index'], 3).setText("准备中...")
+        # Reset table status for selected (one batched model update instead of per-row repaints)
+        self.task_model.set_status_many([item['ui_index'] for item in items_to_download], "准备中...")
 
         self.download_worker = YtDlpDownloadWorker(items_to_download, options, out_dir)
         self.download_worker.progress.connect(self.on_progress)
@@ -425,7 +558,13 @@ class VideoDownloadWidget(QWidget):
         self.btn_download.setStyleSheet("font-weight: bold;")
         QMessageBox.critical(self, "错误", err)
 
-    def on_progress(self, data):
+    def showEvent(self, event):
+        super().showEvent(event)
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None and self.is_downloading:
+            self._update_progress_labels(pending)
+
+    def _update_progress_labels(self, data):
         # 1. Update Overall Progress Bar
         overall = data.get('overall_percent', 0)
         self.overall_progress_bar.setValue(int(overall))
@@ -435,17 +574,23 @@ class VideoDownloadWidget(QWidget):
         display_name = self._truncate(raw_name, 50)
         speed = data.get('speed') or '-'
         self.status_label.setText(f"正在下载: {display_name}  [速度: {speed}]")
+
+    def on_progress(self, data):
+        if self.isVisible():
+            self._update_progress_labels(data)
+        else:
+            self._pending_progress = data
         
         # 3. Update Table Cell (Individual Progress)
         ui_index = data.get('ui_index')
         current_pct = data.get('current_percent', 0)
         file_complete = data.get('file_complete', False)
         
-        if ui_index is not None and 0 <= ui_index < self.table.rowCount():
+        if ui_index is not None:
             if file_complete:
-                self.table.item(ui_index, 3).setText("完成")
+                self.task_model.set_status(ui_index, "完成")
             else:
-                self.table.item(ui_index, 3).setText(f"{current_pct:.1f}%")
+                self.task_model.set_status(ui_index, f"{current_pct:.1f}%", int(current_pct))
 
     # ============ yt-dlp 版本管理相关方法 ============
     
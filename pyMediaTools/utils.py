@@ -1,5 +1,6 @@
 import sys
 import os
+import json
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,12 @@ except Exception:
     except Exception:
         _toml = None
 
+# JSON 编解码：优先使用第三方 `orjson`（更快，直接处理 bytes），缺失时回退到标准库 json。
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 def get_base_dir() -> Path:
     """
@@ -144,6 +151,25 @@ def get_ffprobe_exe() -> str:
     return str(path)
 
 
+def get_cache_dir() -> Path:
+    """返回本地缓存目录（不保证已创建）
+
+    优先使用环境变量 PYMEDIA_CACHE_DIR，否则按平台惯例：
+      - Windows: %LOCALAPPDATA%/pyMediaTools
+      - macOS: ~/Library/Caches/pyMediaTools
+      - 其他: $XDG_CACHE_HOME/pyMediaTools（默认 ~/.cache/pyMediaTools）
+    """
+    env_dir = os.getenv('PYMEDIA_CACHE_DIR')
+    if env_dir:
+        return Path(env_dir).expanduser()
+    if sys.platform == "win32":
+        root = os.getenv('LOCALAPPDATA')
+        return (Path(root) if root else Path.home() / "AppData" / "Local") / "pyMediaTools"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "pyMediaTools"
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache") / "pyMediaTools"
+
+
 def get_default_download_dir() -> Path:
     """返回默认下载目录"""
     config = load_project_config()
@@ -155,4 +181,18 @@ def get_default_download_dir() -> Path:
     if sys.platform == "win32":
         return Path.home() / "Downloads"
     else:
-        return Path.home() / "Downloads"
\ No newline at end of file
+        return Path.home() / "Downloads"
+
+
+def json_dumps(obj) -> bytes:
+    """序列化为紧凑的 UTF-8 JSON 字节串，可直接作为 HTTP 请求体"""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(content: bytes):
+    """按 UTF-8 直接解析 JSON 响应体，跳过 response.json() 的字符集探测"""
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return json.loads(content.decode("utf-8"))
@@ -67,4 +67,5 @@ def test_load_voices_no_key(monkeypatch):
     widget.load_voices(show_errors=False)
     assert not hasattr(widget, 'model_worker')
     assert not hasattr(widget, 'voice_worker')
+    assert not hasattr(widget, 'init_worker')
 
@@ -144,5 +144,23 @@ class TestSubtitleSegmentBuilder(unittest.TestCase):
         segs = self.builder.build_segments(chars, starts, ends, word_level=False, ignore_line_length=True)
         self.assertEqual(len(segs), 1)
 
+    def test_atoms_reuse_matches_build_segments(self):
+        # segmentations derived from one shared atoms object must match the
+        # results of independent build_segments calls
+        txt = "Hello world, this is a test. 中文字幕测试！ Another line here?"
+        chars = list(txt)
+        starts = [i * 0.05 for i in range(len(chars))]
+        ends = [(i + 1) * 0.05 for i in range(len(chars))]
+        atoms = self.builder.build_atoms(chars, starts, ends)
+        for kwargs in (
+            {"word_level": True, "words_per_line": 2},
+            {},
+            {"ignore_line_length": True},
+        ):
+            self.assertEqual(
+                self.builder.build_segments_from_atoms(atoms, **kwargs),
+                self.builder.build_segments(chars, starts, ends, **kwargs),
+            )
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# make sure project root in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pyMediaTools.core.subtitle_writer import SubtitleWriter
+
+
+class TestSubtitleWriter(unittest.TestCase):
+    def test_format_time(self):
+        self.assertEqual(SubtitleWriter._format_time(0), "00:00:00,000")
+        self.assertEqual(SubtitleWriter._format_time(1.5), "00:00:01,500")
+        self.assertEqual(SubtitleWriter._format_time(90.123), "00:01:30,123")
+        self.assertEqual(SubtitleWriter._format_time(3725.25), "01:02:05,250")
+
+    def test_format_time_rounds_to_nearest_ms(self):
+        # 1.005 * 1000 == 1004.999..., truncation used to yield 004 here
+        self.assertEqual(SubtitleWriter._format_time(1.005), "00:00:01,005")
+        self.assertEqual(SubtitleWriter._format_time(2.675), "00:00:02,675")
+        self.assertEqual(SubtitleWriter._format_time(14977.946), "04:09:37,946")
+        self.assertEqual(SubtitleWriter._format_time(59.9996), "00:01:00,000")
+        for ms in range(0, 10_000):
+            self.assertEqual(SubtitleWriter._format_time(ms / 1000)[-3:], "%03d" % (ms % 1000))
+
+    def test_write_srt_skips_empty_and_keeps_numbering(self):
+        segments = [
+            {"text": "first", "start": 0.0, "end": 1.0},
+            {"text": "  ", "start": 1.0, "end": 2.0},
+            {"text": "third", "start": 2.0, "end": 3.5},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.srt")
+            SubtitleWriter.write_srt(path, segments)
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        self.assertEqual(
+            content,
+            "1\n00:00:00,000 --> 00:00:01,000\nfirst\n\n"
+            "3\n00:00:02,000 --> 00:00:03,500\nthird\n\n",
+        )
+
+    def test_write_srt_large_file_is_chunked_completely(self):
+        segments = [{"text": f"line {i}", "start": i, "end": i + 0.5} for i in range(2500)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "big.srt")
+            SubtitleWriter.write_srt(path, segments)
+            with open(path, encoding="utf-8") as f:
+                blocks = f.read().strip().split("\n\n")
+        self.assertEqual(len(blocks), 2500)
+        self.assertTrue(blocks[-1].startswith("2500\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
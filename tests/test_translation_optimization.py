@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import json
 import sys
 import os
 
@@ -13,18 +14,18 @@ class TestTranslationOptimization(unittest.TestCase):
         self.tm = TranslationManager(api_key="test_key")
         self.tm.batch_size = 3  # Small batch size for testing
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_batching_logic(self, mock_post):
         # Setup mock response for a batch translation
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "choices": [{
                 "message": {
-                    "content": "翻译1\n---\n翻译2\n---\n翻译3"
+                    "content": "1. 翻译1\n###SEG_SEP###\n2. 翻译2\n###SEG_SEP###\n3. 翻译3"
                 }
             }]
-        }
+        }).encode("utf-8")
         mock_post.return_value = mock_response
 
         segments = [
@@ -41,7 +42,7 @@ class TestTranslationOptimization(unittest.TestCase):
         # Ensure only 1 API call was made for 3 segments
         self.assertEqual(mock_post.call_count, 1)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     @patch('time.sleep', return_value=None)  # Don't actually sleep in tests
     def test_retry_on_429(self, mock_sleep, mock_post):
         # First call returns 429, second returns 200
@@ -50,13 +51,13 @@ class TestTranslationOptimization(unittest.TestCase):
         
         mock_200 = MagicMock()
         mock_200.status_code = 200
-        mock_200.json.return_value = {
+        mock_200.content = json.dumps({
             "choices": [{
                 "message": {
                     "content": "Success"
                 }
             }]
-        }
+        }).encode("utf-8")
         
         mock_post.side_effect = [mock_429, mock_200]
 
@@ -66,6 +67,26 @@ class TestTranslationOptimization(unittest.TestCase):
         self.assertEqual(mock_post.call_count, 2)
         mock_sleep.assert_called_once()
 
+    @patch('requests.Session.post')
+    @patch('random.uniform', return_value=0)
+    @patch('time.sleep', return_value=None)
+    def test_retry_after_header_is_honored(self, mock_sleep, mock_uniform, mock_post):
+        mock_429 = MagicMock()
+        mock_429.status_code = 429
+        mock_429.headers = {"Retry-After": "7"}
+
+        mock_200 = MagicMock()
+        mock_200.status_code = 200
+        mock_200.headers = {}
+        mock_200.content = json.dumps({"choices": [{"message": {"content": "OK"}}]}).encode("utf-8")
+
+        mock_post.side_effect = [mock_429, mock_200]
+
+        self.assertEqual(self.tm._request_with_retry("system", "user"), "OK")
+        mock_sleep.assert_called_once()
+        waited = mock_sleep.call_args[0][0]
+        self.assertTrue(6.5 < waited <= 7, waited)
+
     def test_numbering_alignment(self):
         # verify that numbering prefixes are added and that out-of-order results get re-aligned
         segments = [{"text": "First"}, {"text": "Second"}, {"text": "Third"}]
@@ -96,5 +117,96 @@ class TestTranslationOptimization(unittest.TestCase):
         self.assertEqual(translated[1]["text"], "译B")
         self.assertEqual(translated[2]["text"], "译C")
 
+    def test_count_mismatch_splits_batch(self):
+        # a reply that merged separators is retried as two halves; small halves
+        # that still mismatch are translated one item at a time
+        sep = "\n###SEG_SEP###\n"
+        texts = [f"{i}. {c}" for i, c in enumerate("ABCDEFGH", 1)]
+        calls = []
+
+        def fake_request(system_content, user_content):
+            calls.append(user_content)
+            items = user_content.split(sep)
+            replies = [t.replace(". ", ". 译") for t in items]
+            if len(items) == 1:
+                return replies[0]
+            if items[0] == "1. A":
+                # merge the first two replies, dropping a separator
+                replies[:2] = [replies[0] + " " + replies[1]]
+            return sep.join(replies)
+        self.tm._request_with_retry = fake_request
+
+        result = self.tm._translate_batch(texts)
+        self.assertEqual(result, [t.replace(". ", ". 译") for t in texts])
+        # full batch, two halves, then the mismatched half item by item
+        self.assertEqual(len(calls), 1 + 2 + 4)
+        self.assertEqual(calls[2:6], texts[:4])
+
+    @patch('requests.Session.post')
+    def test_no_api_key_skips_translation(self, mock_post):
+        with patch.dict(os.environ, {"GROQ_API_KEY": ""}):
+            tm = TranslationManager(api_key=None)
+        segments = [{"text": "Text 1"}]
+        self.assertFalse(tm.is_available())
+        self.assertIs(tm.translate_segments(segments), segments)
+        mock_post.assert_not_called()
+
+    def test_cached_texts_are_not_resent(self):
+        from pyMediaTools.core.translation_cache import TranslationCache
+        self.tm.cache = TranslationCache(":memory:")
+        requested = []
+
+        def fake_translate(batch_texts):
+            requested.append(batch_texts)
+            return [f"{t.split('. ', 1)[0]}. 译{t.split('. ', 1)[1]}" for t in batch_texts]
+        self.tm._translate_batch = fake_translate
+
+        first = self.tm.translate_segments([{"text": "A"}, {"text": "B"}])
+        second = self.tm.translate_segments([{"text": "B"}, {"text": "C"}, {"text": "A"}])
+
+        self.assertEqual([s["text"] for s in first], ["译A", "译B"])
+        self.assertEqual([s["text"] for s in second], ["译B", "译C", "译A"])
+        # only the uncached text goes out on the second run, renumbered from 1
+        self.assertEqual(requested, [["1. A", "2. B"], ["1. C"]])
+        # the model is part of the key
+        self.assertEqual(self.tm.cache.get_many("other-model", ["A"]), {})
+
+    def test_unaligned_results_are_not_cached(self):
+        # results placed by order (no index prefix) are used once but never cached
+        from pyMediaTools.core.translation_cache import TranslationCache
+        self.tm.cache = TranslationCache(":memory:")
+        self.tm._translate_batch = lambda batch_texts: ["1. 译A", "译B"]
+
+        translated = self.tm.translate_segments([{"text": "A"}, {"text": "B"}])
+
+        self.assertEqual([s["text"] for s in translated], ["译A", "译B"])
+        self.assertEqual(self.tm.cache.get_many(self.tm.model, ["A", "B"]), {"A": "译A"})
+
+    def test_duplicate_and_blank_texts_sent_once(self):
+        requested = []
+
+        def fake_translate(batch_texts):
+            requested.append(batch_texts)
+            return [f"{t.split('. ', 1)[0]}. 译{t.split('. ', 1)[1]}" for t in batch_texts]
+        self.tm._translate_batch = fake_translate
+
+        translated = self.tm.translate_segments([{"text": "Yes."}, {"text": " "}, {"text": "Yes."}])
+        self.assertEqual([s["text"] for s in translated], ["译Yes.", " ", "译Yes."])
+        self.assertEqual(requested, [["1. Yes."]])
+
+    def test_concurrent_batches_preserve_order(self):
+        # batches run concurrently; earlier batches finishing last must not reorder output
+        import time as _time
+        segments = [{"text": f"S{i}"} for i in range(10)]
+
+        def fake_translate(batch_texts):
+            first = batch_texts[0].split(". ", 1)[1]
+            _time.sleep(0.05 if first == "S0" else 0)
+            return [f"{t.split('. ', 1)[0]}. 译{t.split('. ', 1)[1]}" for t in batch_texts]
+        self.tm._translate_batch = fake_translate
+
+        translated = self.tm.translate_segments(segments)
+        self.assertEqual([s["text"] for s in translated], [f"译S{i}" for i in range(10)])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QApplication, QStyleFactory, QStyleOptionViewItem, QWidget
+
+# pyMediaTools.ui 包会导入 QtMultimedia，缺少系统音频库时无法加载界面模块
+pytest.importorskip("PySide6.QtMultimedia", exc_type=ImportError)
+
+from pyMediaTools.ui.video_downloader_ui import ProgressBarDelegate, VideoTaskTableModel
+
+
+def ensure_qapp():
+    app = QApplication.instance()
+    if not app:
+        app = QApplication([])
+    return app
+
+
+def _render_progress(progress):
+    model = VideoTaskTableModel()
+    model.set_entries([{"title": "t"}])
+    model.set_status(0, "", progress)
+    index = model.index(0, VideoTaskTableModel.COL_STATUS)
+
+    image = QImage(200, 24, QImage.Format_ARGB32)
+    image.fill(QColor("white"))
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, 200, 24)
+    option.direction = Qt.LeftToRight
+    # 应用启动时强制使用 Fusion，进度条方向问题只在该样式下出现
+    widget = QWidget()
+    widget.setStyle(QStyleFactory.create("Fusion"))
+    option.widget = widget
+    painter = QPainter(image)
+    try:
+        ProgressBarDelegate().paint(painter, option, index)
+    finally:
+        painter.end()
+    return image
+
+
+def test_progress_bar_fills_horizontally():
+    ensure_qapp()
+    empty = _render_progress(0)
+    half = _render_progress(50)
+    row = 12
+
+    def changed(x):
+        return half.pixel(x, row) != empty.pixel(x, row)
+
+    # 50% 时左半部分被填充，右半部分与 0% 相同
+    assert changed(40)
+    assert not changed(160)